@@ -1,3 +1,4 @@
+import contextlib
 import copy
 import io
 import logging
@@ -13,6 +14,7 @@ from src.bom_lib import (
     StatsDict,
     calculate_net_needs,
     create_empty_inventory,
+    create_empty_stats,
     generate_pedalpcb_url,
     generate_search_term,
     generate_tayda_url,
@@ -23,7 +25,7 @@ from src.bom_lib import (
     get_spec_type,
     get_standard_hardware,
     parse_user_inventory,
-    process_input_data,
+    process_input_batch,
     rename_source_in_inventory,
     sort_inventory,
 )
@@ -477,26 +479,24 @@ if st.button("Generate Master List", type="primary", width="stretch"):
 
     inventory = create_empty_inventory()
 
-    stats: StatsDict = {
-        "lines_read": 0,
-        "parts_found": 0,
-        "residuals": [],
-        "extracted_title": None,
-        "seen_refs": set(),
-        "errors": [],
-    }
+    stats = create_empty_stats()
 
-    # Process Each Slot
-    for i, slot in enumerate(st.session_state.pedal_slots):
-        # Resolve Name
+    # Resolve Names
+    slots = st.session_state.pedal_slots
+    jobs = []
+    for i, slot in enumerate(slots):
         current_name = str(slot.name or "")
         source = current_name if current_name.strip() else f"Project #{i + 1}"
-        qty_multiplier = slot.count
+        jobs.append((slot.method, slot.data, source))
 
-        # Unified Processing
-        p_inv, p_stats, detected_title, raw_content = process_input_data(
-            slot.method, slot.data, source_name=source
-        )
+    # Unified Processing (projects load concurrently, results stay in order)
+    results = process_input_batch(jobs)
+
+    # Process Each Slot
+    for slot, (_, _, source), result in zip(slots, jobs, results, strict=True):
+        current_name = str(slot.name or "")
+        qty_multiplier = slot.count
+        p_inv, p_stats, detected_title, raw_content = result
 
         # Store the raw content in the slot if it was returned (i.e. it was a PDF)
         if raw_content:
@@ -534,8 +534,8 @@ if st.button("Generate Master List", type="primary", width="stretch"):
         try:
             stock_inventory = parse_user_inventory(tmp_path)
         finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
 
     st.session_state.inventory = inventory
     st.session_state.stock = stock_inventory  # Save to session
@@ -568,7 +568,7 @@ if st.session_state.inventory and st.session_state.stats:
         c1, c2, c3 = st.columns(3)
         c1.metric("Lines Scanned", stats["lines_read"])
         c2.metric("Parts Found", stats["parts_found"])
-        unique_parts = len(sort_inventory(inventory))
+        unique_parts = len(inventory)
         c3.metric("Unique SKUs", unique_parts)
 
     st.divider()
@@ -678,17 +678,13 @@ if st.session_state.inventory and st.session_state.stats:
         spec_type = get_spec_type(category, value)
         search_term = generate_search_term(category, value, spec_type)
 
-        # Link Generation Logic
-        is_pedalpcb_source = any("PedalPCB" in s for s in sources)
-        is_tayda_source = any("Tayda" in s for s in sources)
-
+        # Link Generation Logic (only PCBs can come from PedalPCB)
+        url = generate_tayda_url(search_term)
         if category == "PCB":
+            is_pedalpcb_source = any("PedalPCB" in s for s in sources)
+            is_tayda_source = any("Tayda" in s for s in sources)
             if is_pedalpcb_source and not is_tayda_source:
                 url = generate_pedalpcb_url(search_term)
-            else:
-                url = generate_tayda_url(search_term)
-        else:
-            url = generate_tayda_url(search_term)
 
         final_data.append(
             {
@@ -6,7 +6,7 @@ and sourcing.
 """
 
 from .classifier import categorize_part, normalize_value_by_category
-from .loader import process_input_data
+from .loader import process_input_batch, process_input_data
 from .manager import (
     calculate_net_needs,
     rename_source_in_inventory,
@@ -35,6 +35,7 @@ from .types import (
     ProjectSlot,
     StatsDict,
     create_empty_inventory,
+    create_empty_stats,
 )
 from .utils import (
     deduplicate_refs,
@@ -49,6 +50,7 @@ __all__ = [
     # types
     "StatsDict",
     "create_empty_inventory",
+    "create_empty_stats",
     "PartData",
     "Inventory",
     "ProjectSlot",
@@ -80,6 +82,7 @@ __all__ = [
     "get_preset_metadata",
     "BOM_PRESETS",
     # loader
+    "process_input_batch",
     "process_input_data",
     # classifier
     "categorize_part",
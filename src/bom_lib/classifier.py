@@ -6,12 +6,54 @@ based on its reference designator (R1, U1) and value. It also normalizes
 values to ensure consistent matching between BOMs and Inventory.
 """
 
+import functools
 import re
 
 import src.bom_lib.constants as C
 from src.bom_lib.utils import float_to_search_string, parse_value_to_float
 
-
+# Prefix tables for str.startswith(tuple), which scans them in C.
+_VALID_PREFIXES = C.CORE_PREFIXES + ("OP", "TL", "LDR", "LED")
+_IC_LIKE_PREFIXES = ("IC", "U", "Q", "OP", "TL")
+
+# ASCII digits, for set-based "contains a digit" checks
+_DIGITS = frozenset("0123456789")
+
+# Pot taper markings on the value: "100k-B" (suffix) or "B100k" (prefix)
+_TAPER_CHARS = "".join(C.POT_TAPER_MAP.keys())
+_TAPER_SUFFIX_RE = re.compile(rf"[0-9]+.*[{_TAPER_CHARS}]$")
+_TAPER_PREFIX_RE = re.compile(rf"^[{_TAPER_CHARS}][0-9]+")
+
+# Standard designators, keyed on their first letter: (full prefix, category).
+# No two prefixes share an initial, so one dict lookup replaces the elif chain.
+_CATEGORY_BY_INITIAL = {
+    "R": ("R", "Resistors"),
+    "C": ("C", "Capacitors"),
+    "D": ("D", "Diodes"),
+    "Q": ("Q", "Transistors"),
+    "S": ("SW", "Switches"),
+    "L": ("LED", "Diodes"),
+    "X": ("X", "Crystals/Oscillators"),
+    "Y": ("Y", "Crystals/Oscillators"),
+    "J": ("J", "Hardware/Misc"),
+    "U": ("U", "ICs"),
+    "I": ("IC", "ICs"),
+    "O": ("OP", "ICs"),
+    "T": ("TL", "ICs"),
+}
+
+# IC values that aren't DIP chips (e.g., Regulators, Reverb Bricks) get no socket
+_SKIP_INJECTION_RE = re.compile("REGULATOR|L78L|MODULE|BTDR|REVERB")
+
+# Pre-formatted "Category | Value" key for auto-injected IC sockets
+_DIP_SOCKET_INJECTION = "Hardware/Misc | DIP SOCKET (Check Size)"
+
+# Pot labels as one prefix tuple: a single C-level startswith() scan beats
+# both a compiled alternation regex and a per-initial bucket lookup here.
+_POT_LABEL_PREFIXES = tuple(sorted(C.POT_LABELS))
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_value_by_category(category: str, val_raw: str) -> str:
     """
     Standardizes component values for consistent string matching.
@@ -31,24 +73,25 @@ def normalize_value_by_category(category: str, val_raw: str) -> str:
 
     # Only normalize Passives (Resistors/Caps)
     if category in ("Resistors", "Capacitors"):
-        # Exception: Don't normalize physical dimensions (e.g., "5mm LDR")
-        if "mm" in clean_val.lower():
-            return clean_val
-
         fval = parse_value_to_float(clean_val)
-        if fval is not None:
+
+        # Exception: Don't normalize physical dimensions (e.g., "5mm LDR").
+        # Only values that parsed need the (allocating) case-folded check.
+        if fval is not None and "mm" not in clean_val.lower():
             clean_val = float_to_search_string(fval)
 
     return clean_val
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_part(ref: str, val: str) -> tuple[str | None, str | None, str | None]:
     """
     Classifies a component based on its Reference Designator and Value.
 
     This function acts as a rules engine. It checks standard prefixes (R, C, Q),
     identifies potentiometers by known names (VOL, GAIN) or taper markings
-    (A100k), and handles special cases like LDRs.
+    (A100k), and handles special cases like LDRs. Results are memoized, as
+    BOMs repeat the same (ref, value) shapes heavily.
 
     Args:
         ref: The reference designator (e.g., "R1", "VOLUME", "IC1").
@@ -67,29 +110,24 @@ def categorize_part(ref: str, val: str) -> tuple[str | None, str | None, str | N
     val_up = val_clean.upper()  # Use this for internal logic
 
     # 1. Validate Prefix / Structure
-    valid_prefixes = C.CORE_PREFIXES + ("OP", "TL", "LDR", "LED")
-
     # Standard components (R1, C1) usually require a digit.
     # Named controls (VOLUME, SW_BRIGHT) do not.
-    has_digit = any(char.isdigit() for char in ref_up)
+    has_digit = not _DIGITS.isdisjoint(ref_up)
 
     # 2. Taper Check (Potentiometer Heuristic)
     # Detects pots by value style (e.g., "B100k", "10k-A") if the ref isn't obviously a chip.
-    is_pot_value = False
-    if not ref_up.startswith(("IC", "U", "Q", "OP", "TL")):
-        taper_chars = "".join(C.POT_TAPER_MAP.keys())
-        # Matches "B100k" or "100k-B"
-        if re.search(rf"[0-9]+.*[{taper_chars}]$", val_up) or re.search(
-            rf"^[{taper_chars}][0-9]+", val_up
-        ):
-            is_pot_value = True
+    # Matches "B100k" or "100k-B"
+    is_pot_value = not ref_up.startswith(_IC_LIKE_PREFIXES) and bool(
+        _TAPER_SUFFIX_RE.search(val_up) or _TAPER_PREFIX_RE.search(val_up)
+    )
 
     # 3. Validity Check
+    # Every label is a prefix of itself, so this also covers exact matches
+    is_pot_label = ref_up.startswith(_POT_LABEL_PREFIXES)
     is_valid = (
-        (any(ref_up.startswith(p) for p in valid_prefixes) and has_digit)
-        or ref_up in C.POT_LABELS
+        (ref_up.startswith(_VALID_PREFIXES) and has_digit)
+        or is_pot_label
         or ref_up in C.SWITCH_LABELS
-        or any(ref_up.startswith(label) for label in C.POT_LABELS)
         or is_pot_value
         or ref_up == "CLR"
     )
@@ -106,11 +144,7 @@ def categorize_part(ref: str, val: str) -> tuple[str | None, str | None, str | N
         return "Optoelectronics", val_clean, None
 
     # Potentiometers (Priority over Resistors to catch 'RANGE')
-    if (
-        ref_up in C.POT_LABELS
-        or any(ref_up.startswith(label) for label in C.POT_LABELS)
-        or is_pot_value
-    ):
+    if is_pot_label or is_pot_value:
         category = "Potentiometers"
 
     # Switches
@@ -122,32 +156,16 @@ def categorize_part(ref: str, val: str) -> tuple[str | None, str | None, str | N
             category = "Potentiometers"  # Fallback
 
     # Standard Components
-    elif ref_up == "CLR" or (ref_up.startswith("R") and not ref_up.startswith("RANGE")):
+    elif ref_up == "CLR":
         category = "Resistors"
-    elif ref_up.startswith("C"):
-        category = "Capacitors"
-    elif ref_up.startswith("D"):
-        category = "Diodes"
-    elif ref_up.startswith("Q"):
-        category = "Transistors"
-    elif ref_up.startswith("SW"):
-        category = "Switches"
-    elif ref_up.startswith("LED"):
-        category = "Diodes"
-    elif ref_up.startswith(("X", "Y")):
-        category = "Crystals/Oscillators"
-    elif ref_up.startswith("J"):
-        category = "Hardware/Misc"
-
-    # ICs & Socket Injection
-    elif ref_up.startswith(("U", "IC", "OP", "TL")):
-        category = "ICs"
-
-        # Don't inject sockets for things that aren't DIP chips
-        # (e.g., Regulators, Reverb Bricks)
-        skip_injection_keywords = ["REGULATOR", "L78L", "MODULE", "BTDR", "REVERB"]
-        if not any(k in val_up for k in skip_injection_keywords):
-            injection = "Hardware/Misc | DIP SOCKET (Check Size)"
+    else:
+        rule = _CATEGORY_BY_INITIAL.get(ref_up[:1])
+        if rule and ref_up.startswith(rule[0]) and not ref_up.startswith("RANGE"):
+            category = rule[1]
+
+        # ICs & Socket Injection (skipped for things that aren't DIP chips)
+        if category == "ICs" and not _SKIP_INJECTION_RE.search(val_up):
+            injection = _DIP_SOCKET_INJECTION
 
     # Final Normalization
     val_clean = normalize_value_by_category(category, val_clean)
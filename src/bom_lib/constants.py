@@ -17,12 +17,12 @@ from typing import Any
 
 # SI Prefix Multipliers
 # Maps shorthand prefixes to their float multipliers.
-# Includes 'u' (legacy) and 'µ' (correct) for micro-farads.
+# Micro is ASCII 'u' only; the unicode micro/mu signs are folded to 'u'
+# by the value parser before lookup.
 MULTIPLIERS = {
     "p": 1e-12,  # pico
     "n": 1e-9,  # nano
-    "u": 1e-6,  # micro (standard text)
-    "µ": 1e-6,  # micro (alt/unicode)
+    "u": 1e-6,  # micro
     "m": 1e-3,  # milli
     "k": 1e3,  # kilo
     "K": 1e3,  # kilo (uppercase tolerance)
@@ -263,93 +263,95 @@ KEYWORDS = sorted(POT_NAMES | SWITCH_LABELS | KEYWORD_EXTRAS)
 # Manufacturing Artifact Exclusion List
 # These tokens indicate lines in a BOM that describe non-purchasable items
 # (e.g., Test Points, Fiduciaries, PCB layers) or explicitly excluded parts.
-IGNORE_VALUES = [
-    # --- Manufacturing Artifacts (Ghost Data) ---
-    "TP",
-    "TPOINT",
-    "TEST POINT",
-    "TEST",
-    "PROBE",
-    "FID",
-    "FIDUCIAL",
-    "MARK",
-    "ALIGN",
-    "MARKER",
-    "MH",
-    "HOLE",
-    "MOUNTING HOLE",
-    "MTG",
-    "DRILL",
-    "SCREW HOLE",
-    "JP",
-    "JUMPER",
-    "SJ",
-    "SOLDER JUMPER",
-    "LINK",
-    "WIRE",
-    "BRIDGE",
-    "IO",
-    "PAD",
-    "VIA",
-    # --- Logic Flags & Exclusion ---
-    "DNP",
-    "DNI",
-    "NM",
-    "NC",
-    "NO POP",
-    "DO NOT POPULATE",
-    "NOT MOUNTED",
-    "OPT",
-    "OPTIONAL",
-    "OMIT",
-    "UNUSED",
-    # --- Non-Component Layers & Nets ---
-    "PCB",
-    "BOARD",
-    "PANEL",
-    "FACEPLATE",
-    "LOGO",
-    "GRAPHIC",
-    "ART",
-    "SILKSCREEN",
-    "TEXT",
-    "LABEL",
-    "ROHS",
-    "LEAD FREE",
-    "PB-FREE",
-    "UL",
-    "FCC",
-    "CE",
-    "TRASH BIN",
-    "GND",
-    "AGND",
-    "DGND",
-    "PGND",
-    "EARTH",
-    "VCC",
-    "VDD",
-    "VSS",
-    "VEE",
-    "VREF",
-    "VB",
-    "VA",
-    "+9V",
-    "+18V",
-    "-9V",
-    "+5V",
-    "+3V3",
-    "BIAS",
-    "NOTE",
-    "INFO",
-    "COMMENT",
-    "DESC",
-    "DESCRIPTION",
-    "DIP",
-    "DIP8",
-    "DIP14",
-    "DIP16",
-    "SOIC",
-    "SOIC8",
-    "PACKAGE",
-    "PKG",
-]
+IGNORE_VALUES = frozenset(
+    {
+        # --- Manufacturing Artifacts (Ghost Data) ---
+        "TP",
+        "TPOINT",
+        "TEST POINT",
+        "TEST",
+        "PROBE",
+        "FID",
+        "FIDUCIAL",
+        "MARK",
+        "ALIGN",
+        "MARKER",
+        "MH",
+        "HOLE",
+        "MOUNTING HOLE",
+        "MTG",
+        "DRILL",
+        "SCREW HOLE",
+        "JP",
+        "JUMPER",
+        "SJ",
+        "SOLDER JUMPER",
+        "LINK",
+        "WIRE",
+        "BRIDGE",
+        "IO",
+        "PAD",
+        "VIA",
+        # --- Logic Flags & Exclusion ---
+        "DNP",
+        "DNI",
+        "NM",
+        "NC",
+        "NO POP",
+        "DO NOT POPULATE",
+        "NOT MOUNTED",
+        "OPT",
+        "OPTIONAL",
+        "OMIT",
+        "UNUSED",
+        # --- Non-Component Layers & Nets ---
+        "PCB",
+        "BOARD",
+        "PANEL",
+        "FACEPLATE",
+        "LOGO",
+        "GRAPHIC",
+        "ART",
+        "SILKSCREEN",
+        "TEXT",
+        "LABEL",
+        "ROHS",
+        "LEAD FREE",
+        "PB-FREE",
+        "UL",
+        "FCC",
+        "CE",
+        "TRASH BIN",
+        "GND",
+        "AGND",
+        "DGND",
+        "PGND",
+        "EARTH",
+        "VCC",
+        "VDD",
+        "VSS",
+        "VEE",
+        "VREF",
+        "VB",
+        "VA",
+        "+9V",
+        "+18V",
+        "-9V",
+        "+5V",
+        "+3V3",
+        "BIAS",
+        "NOTE",
+        "INFO",
+        "COMMENT",
+        "DESC",
+        "DESCRIPTION",
+        "DIP",
+        "DIP8",
+        "DIP14",
+        "DIP16",
+        "SOIC",
+        "SOIC8",
+        "PACKAGE",
+        "PKG",
+    }
+)
@@ -2,40 +2,48 @@
 Input handling and parsing orchestration.
 
 This module abstracts the source of the BOM data (File, URL, Text)
-from the logic used to parse it. It handles HTTP requests, temporary files,
-and parser dispatching.
+from the logic used to parse it. It handles HTTP requests, in-memory file
+buffers, and parser dispatching.
 """
 
+import io
 import logging
 import os
-import tempfile
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.bom_lib.parser import (
     parse_csv_bom,
     parse_pedalpcb_pdf,
     parse_with_verification,
 )
-from src.bom_lib.types import Inventory, StatsDict, create_empty_inventory
+from src.bom_lib.types import (
+    Inventory,
+    StatsDict,
+    create_empty_inventory,
+    create_empty_stats,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated URL imports reuse pooled keep-alive connections
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Upper bound on projects loaded concurrently (matches the HTTP pool size)
+_MAX_LOAD_WORKERS = 8
+
 
 def _process_pdf_content(
     content: bytes, source_name: str
 ) -> tuple[Inventory, StatsDict]:
-    """Helper to handle binary PDF content via temp file."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(content)
-        tmp_path = tmp.name
-
-    try:
-        return parse_pedalpcb_pdf(tmp_path, source_name=source_name)
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    """Helper to parse binary PDF content from memory."""
+    return parse_pedalpcb_pdf(io.BytesIO(content), source_name=source_name)
 
 
 def process_input_data(
@@ -51,7 +59,7 @@ def process_input_data(
 
     Returns:
         A tuple containing:
-            - InventoryType: The parsed inventory structure.
+            - Inventory: The parsed inventory structure.
             - StatsDict: Parsing statistics.
             - str | None: The detected project title (if available).
             - bytes | None: The raw binary content (if a file/URL was processed).
@@ -60,14 +68,7 @@ def process_input_data(
     if not data:
         return (
             create_empty_inventory(),
-            {
-                "lines_read": 0,
-                "parts_found": 0,
-                "residuals": [],
-                "extracted_title": None,
-                "seen_refs": set(),
-                "errors": [],
-            },
+            create_empty_stats(),
             None,
             None,
         )
@@ -82,18 +83,17 @@ def process_input_data(
         # B. URL
         elif method == "From URL":
             url = str(data).strip()
-            response = requests.get(url, timeout=10)
+            response = _HTTP.get(url, timeout=10)
             response.raise_for_status()
+            content = response.content
 
             # Detection
-            is_pdf = url.lower().endswith(".pdf") or response.content.startswith(
-                b"%PDF"
-            )
+            is_pdf = url.lower().endswith(".pdf") or content.startswith(b"%PDF")
 
             if is_pdf:
-                inv, stats = _process_pdf_content(response.content, source_name)
+                inv, stats = _process_pdf_content(content, source_name)
                 # Return content bytes so the UI can cache them
-                return inv, stats, stats.get("extracted_title"), response.content
+                return inv, stats, stats.get("extracted_title"), content
             else:
                 inv, stats = parse_with_verification(
                     [response.text], source_name=source_name
@@ -115,43 +115,46 @@ def process_input_data(
                 inv, stats = _process_pdf_content(content, source_name)
                 return inv, stats, stats.get("extracted_title"), content
             else:
-                # CSV / Text handling via temp file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-                    tmp.write(content)
-                    tmp_path = tmp.name
-                try:
-                    inv, stats = parse_csv_bom(tmp_path, source_name=source_name)
-                    return inv, stats, None, None
-                finally:
-                    if os.path.exists(tmp_path):
-                        os.remove(tmp_path)
+                # CSV / Text handling, parsed straight from memory
+                text = io.StringIO(content.decode("utf-8-sig"))
+                inv, stats = parse_csv_bom(text, source_name=source_name)
+                return inv, stats, None, None
 
     except Exception as e:
         logger.error(f"Error processing {source_name}: {e}")
         return (
             create_empty_inventory(),
-            {
-                "lines_read": 0,
-                "parts_found": 0,
-                "residuals": [],
-                "extracted_title": None,
-                "seen_refs": set(),
-                "errors": [str(e)],
-            },
+            create_empty_stats(str(e)),
             None,
             None,
         )
 
     return (
         create_empty_inventory(),
-        {
-            "lines_read": 0,
-            "parts_found": 0,
-            "residuals": [],
-            "extracted_title": None,
-            "seen_refs": set(),
-            "errors": ["Unknown Method"],
-        },
+        create_empty_stats("Unknown Method"),
         None,
         None,
     )
+
+
+def process_input_batch(
+    jobs: Sequence[tuple[str, Any, str]],
+) -> list[tuple[Inventory, StatsDict, str | None, bytes | None]]:
+    """
+    Runs process_input_data() for several projects concurrently.
+
+    Each job is independent, so URL downloads and file parsing overlap
+    across a thread pool instead of running back to back. Results are
+    returned in job order so callers can merge them deterministically.
+
+    Args:
+        jobs: (method, data, source_name) tuples, one per project.
+
+    Returns:
+        One process_input_data() result tuple per job, in the same order.
+    """
+    if len(jobs) <= 1:
+        return [process_input_data(*job) for job in jobs]
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), _MAX_LOAD_WORKERS)) as pool:
+        return list(pool.map(lambda job: process_input_data(*job), jobs))
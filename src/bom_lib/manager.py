@@ -11,6 +11,22 @@ This module acts as the "Controller" for the BOM library. It handles:
 from src.bom_lib.types import Inventory, PartData
 from src.bom_lib.utils import parse_value_to_float
 
+# Display order for inventory categories, mapped to a sort rank.
+_CATEGORY_ORDER = (
+    "PCB",
+    "ICs",
+    "Crystals/Oscillators",
+    "Optoelectronics",
+    "Transistors",
+    "Diodes",
+    "Potentiometers",
+    "Switches",
+    "Capacitors",
+    "Resistors",
+    "Hardware/Misc",
+)
+_CATEGORY_RANK = {name: i for i, name in enumerate(_CATEGORY_ORDER)}
+
 
 def calculate_net_needs(bom: Inventory, stock: Inventory) -> Inventory:
     """
@@ -24,21 +40,16 @@ def calculate_net_needs(bom: Inventory, stock: Inventory) -> Inventory:
         A new Inventory dictionary containing ONLY the items that need to be purchased.
         Quantities are set to `max(0, required - owned)`.
     """
+    # Built in one comprehension: metadata is preserved, Qty becomes the
+    # Net Need (Need - Have, floored at 0).
     net_inv = Inventory()
-
-    for key, data in bom.items():
-        gross_needed = data["qty"]
-
-        # Check stock
-        stock_data = stock.get(key)
-        in_stock = stock_data["qty"] if stock_data else 0
-
-        # The Math: (Need - Have), floored at 0
-        net_needed = max(0, gross_needed - in_stock)
-
-        # Preserve metadata, but update Qty to the Net Need
-        net_inv[key] = data.copy()
-        net_inv[key]["qty"] = net_needed
+    net_inv.data = {
+        key: {
+            **data,
+            "qty": max(0, data["qty"] - (stock[key]["qty"] if key in stock else 0)),
+        }
+        for key, data in bom.items()
+    }
 
     return net_inv
 
@@ -58,32 +69,19 @@ def sort_inventory(inventory: Inventory) -> list[tuple[str, PartData]]:
     Returns:
         A list of (key, data) tuples sorted by category and value.
     """
-    order = [
-        "PCB",
-        "ICs",
-        "Crystals/Oscillators",
-        "Optoelectronics",
-        "Transistors",
-        "Diodes",
-        "Potentiometers",
-        "Switches",
-        "Capacitors",
-        "Resistors",
-        "Hardware/Misc",
-    ]
-    # Map name to index for sorting efficiency
-    pmap = {name: i for i, name in enumerate(order)}
 
     def sort_key(item: tuple[str, PartData]) -> tuple[int, float, str]:
-        key = item[0]
-        if " | " not in key:
+        key, data = item
+        cat, sep, val = key.partition(" | ")
+        if not sep:
             return (999, 0.0, key)
 
-        cat, val = key.split(" | ", 1)
-        rank = pmap.get(cat, 100)
+        rank = _CATEGORY_RANK.get(cat, 100)
 
-        # Parse value for sorting
-        fval = parse_value_to_float(val)
+        # Prefer the value cached on the part; parse only if it's missing
+        fval = data.get("val_float")
+        if fval is None:
+            fval = parse_value_to_float(val)
         if fval is None:
             fval = 0.0
 
@@ -6,15 +6,25 @@ This module handles the extraction of component data from various file formats
 delegation to the classification engine.
 """
 
+import contextlib
 import csv
+import itertools
 import logging
 import re
 import traceback
-from typing import Any
+from collections.abc import Iterable
+from io import BytesIO
+from operator import itemgetter
+from typing import IO, Any
 
 import src.bom_lib.constants as C
 from src.bom_lib.classifier import categorize_part, normalize_value_by_category
-from src.bom_lib.types import Inventory, StatsDict, create_empty_inventory
+from src.bom_lib.types import (
+    Inventory,
+    StatsDict,
+    create_empty_inventory,
+    create_empty_stats,
+)
 from src.bom_lib.utils import expand_refs
 
 # Initialize Logger
@@ -33,6 +43,70 @@ _REGEX_STRICT = re.compile(rf"{_REF_PATTERN_STRICT}\s+(?P<val>[^\s]+)", re.IGNOR
 _REF_PATTERN_LOOSE = rf"(?P<ref>\b[A-Z]{{1,4}}\d+\b|{_KW_REGEX_STR})"
 _REGEX_LOOSE = re.compile(rf"{_REF_PATTERN_LOOSE}\s+(?P<val>[^\s]+)", re.IGNORECASE)
 
+# 4. Manual Input Pattern (Ref + Separator + Value)
+# Compiled once at import time. Anchored and without a trailing wildcard, so
+# the match stops as soon as the value token ends instead of consuming the line.
+_REGEX_MANUAL_LINE = re.compile(r"^([a-zA-Z0-9_\-]+)[\s,]+([0-9a-zA-Z\.\-\/]+)")
+
+# Keyword labels as a set for O(1) membership (C.KEYWORDS is a sorted list)
+_KEYWORD_SET = frozenset(C.KEYWORDS)
+
+# CSV header aliases, in priority order
+_CSV_REF_COLUMNS = ("ref", "designator", "part", "location")
+_CSV_VAL_COLUMNS = ("value", "val", "description")
+
+# Read buffer for CSV ingestion (fewer read syscalls on large files)
+_CSV_BUFFER = 1 << 20
+
+# pdfplumber's default "lines" table strategy builds cells from ruling edges;
+# fewer than this many edges on a page cannot form a single cell.
+_MIN_TABLE_EDGES = 4
+
+# Designator prefixes accepted from loose text extraction
+_TEXT_REF_PREFIXES = C.CORE_PREFIXES + ("POT", "VR", "L", "LD")
+
+# Large-print page 1 words that are branding/boilerplate, never the title
+_TITLE_IGNORE_WORDS = frozenset(
+    {
+        "PEDALPCB",
+        "CONTROLS",
+        "REVISION",
+        "COPYRIGHT",
+        "WWW.PEDALPCB.COM",
+        "LEVEL",
+        "VCC",
+        "GND",
+    }
+)
+
+# Table summary rows (e.g., "1 x 100k")
+_SUMMARY_ROW_RE = re.compile(r"^\d+\s*[xX]")
+
+# Text-fallback values that are prose ("see note") or dates ("12/05/2024")
+_PROSE_VALUE_RE = re.compile(r"^(is|see|note)\s", re.IGNORECASE)
+_DATE_VALUE_RE = re.compile(r"^\d{1,2}[\.\-\/]\d{1,2}[\.\-\/]\d{2,4}")
+
+# Multi-token value filters for the text fallback, each compiled into a
+# single alternation so one C-level scan replaces a Python any() loop
+_IGNORE_VALUES_RE = re.compile("|".join(map(re.escape, sorted(C.IGNORE_VALUES))))
+_SWITCH_TOKENS_RE = re.compile("SPDT|DPDT|3PDT|ON/ON|ON/OFF")
+
+# Package/chip words that can't start a control's value (e.g. "LOOP IC1")
+_KEYWORD_BAD_STARTS = (
+    "IC",
+    "DIP",
+    "SOIC",
+    "PKG",
+    "MODULE",
+    "PCB",
+    "TL",
+    "OP",
+    "NE5",
+)
+
+# ASCII digits, for set-based "contains a digit" checks
+_DIGITS = frozenset("0123456789")
+
 
 def ingest_bom_line(
     inventory: Inventory,
@@ -58,36 +132,80 @@ def ingest_bom_line(
         val_raw: Raw value string (e.g., "10k").
         stats: Optional stats object to track duplicate refs and counts.
 
+    Returns:
+        The number of valid parts successfully found and recorded.
+    """
+    return ingest_bom_batch(inventory, source, ((ref_raw, val_raw),), stats)
+
+
+def ingest_bom_batch(
+    inventory: Inventory,
+    source: str,
+    rows: Iterable[tuple[str, str]],
+    stats: StatsDict | None = None,
+    pending: dict[str, list[str]] | None = None,
+) -> int:
+    """
+    Ingests many (ref, value) rows in one pass.
+
+    Equivalent to calling ingest_bom_line() for each row in order, but
+    refs are grouped per component key and recorded once per key at the
+    end, so a whole table lands in the inventory with one extend per key.
+
+    Args:
+        inventory: The master inventory dictionary to update.
+        source: The name of the file/project being ingested.
+        rows: Raw (reference, value) pairs (e.g., [("R1-R4", "10k")]).
+        stats: Optional stats object to track duplicate refs and counts.
+        pending: Optional caller-owned buffer. When given, refs are only
+            grouped into it and the caller records them later with
+            _commit_pending(), so a whole file is flushed once.
+
     Returns:
         The number of valid parts successfully found and recorded.
     """
     parts_found = 0
-    expanded_refs = expand_refs(ref_raw)
+    seen = stats["seen_refs"] if stats is not None and "seen_refs" in stats else None
 
-    for r in expanded_refs:
-        # De-dupe Check
-        if stats is not None and "seen_refs" in stats:
-            if r in stats["seen_refs"]:
-                continue
-            stats["seen_refs"].add(r)
+    # Refs grouped per key, in first-seen order
+    batches: dict[str, list[str]] = {} if pending is None else pending
+
+    for ref_raw, val_raw in rows:
+        for r in expand_refs(ref_raw):
+            # De-dupe Check
+            if seen is not None:
+                if r in seen:
+                    continue
+                seen.add(r)
 
-        cat, clean_val, inj = categorize_part(r, val_raw)
+            cat, clean_val, inj = categorize_part(r, val_raw)
 
-        if cat:
-            parts_found += 1
-            main_key = f"{cat} | {clean_val}"
+            if cat:
+                parts_found += 1
 
-            # 1. Record Main Part
-            inventory.add_part(source, main_key, r)
+                # 1. Record Main Part
+                batches.setdefault(f"{cat} | {clean_val}", []).append(r)
 
-            # 2. Handle Auto-Injection (e.g., Sockets)
-            if inj:
-                # inj is pre-formatted as "Category | Value"
-                inventory.add_part(source, inj, f"{r} (Inj)")
+                # 2. Handle Auto-Injection (e.g., Sockets)
+                if inj:
+                    # inj is pre-formatted as "Category | Value"
+                    batches.setdefault(inj, []).append(f"{r} (Inj)")
+
+    if pending is None:
+        _commit_pending(inventory, source, batches)
 
     return parts_found
 
 
+def _commit_pending(
+    inventory: Inventory, source: str, pending: dict[str, list[str]]
+) -> None:
+    """Records buffered refs, one batch per key in first-seen order."""
+    for key, refs in pending.items():
+        inventory.add_parts(source, key, refs)
+    pending.clear()
+
+
 def parse_with_verification(
     bom_list: list[str], source_name: str = "Manual Input"
 ) -> tuple[Inventory, StatsDict]:
@@ -104,70 +222,71 @@ def parse_with_verification(
         A tuple of (Updated Inventory, Parsing Statistics).
     """
     inventory = create_empty_inventory()
-    stats: StatsDict = {
-        "lines_read": 0,
-        "parts_found": 0,
-        "residuals": [],
-        "extracted_title": None,
-        "seen_refs": set(),
-        "errors": [],
-    }
+    stats = create_empty_stats()
 
-    # Regex: Matches Ref + Separator + Value.
-    pattern = re.compile(r"^([a-zA-Z0-9_\-]+)[\s,]+([0-9a-zA-Z\.\-\/]+).*")
+    # Flatten every text block into one stream of stripped lines
+    lines = (line.strip() for raw_text in bom_list for line in raw_text.split("\n"))
 
-    for raw_text in bom_list:
-        lines = raw_text.strip().split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line:
+    for line in lines:
+        if not line:
+            continue
+        stats["lines_read"] += 1
+
+        # Check for PCB Definition (Prefix "PCB" + Value). Only lines that
+        # start with those letters pay for the token split.
+        parts = line.split(None, 1) if line[:3].upper() == "PCB" else None
+        if parts and parts[0].upper() == "PCB":
+            # Skip header "PCB"
+            if len(parts) == 1:
                 continue
-            stats["lines_read"] += 1
-
-            # Check for PCB Definition (Prefix "PCB" + Value)
-            parts = line.split(None, 1)
-            if parts and parts[0].upper() == "PCB":
-                # Skip header "PCB"
-                if len(parts) == 1:
-                    continue
 
-                clean_name = parts[1].strip()
-                key = f"PCB | {clean_name}"
+            clean_name = parts[1].strip()
+            pcb = inventory[f"PCB | {clean_name}"]
+            pcb["qty"] += 1
+            pcb_sources = pcb["sources"][source_name]
+            if "PCB" not in pcb_sources:
+                pcb_sources.append("PCB")
 
-                inventory[key]["qty"] += 1
-                if "PCB" not in inventory[key]["sources"][source_name]:
-                    inventory[key]["sources"][source_name].append("PCB")
+            stats["parts_found"] += 1
+            continue
 
+        match = _REGEX_MANUAL_LINE.match(line)
+        success = False
+
+        if match:
+            ref_raw = match.group(1).upper()
+            val_raw = match.group(2)
+            count = ingest_bom_line(inventory, source_name, ref_raw, val_raw, stats)
+            if count > 0:
+                stats["parts_found"] += count
+                success = True
+
+        if not success:
+            # Fallback: Check if line contains "PCB" (heuristic).
+            # A bare "PCB" header never reaches here (skipped above).
+            if "PCB" in line.upper():
+                pcb = inventory[f"PCB | {line}"]
+                pcb["qty"] += 1
+                pcb_sources = pcb["sources"][source_name]
+                if "PCB" not in pcb_sources:
+                    pcb_sources.append("PCB")
                 stats["parts_found"] += 1
-                continue
-
-            match = pattern.match(line)
-            success = False
+            else:
+                stats["residuals"].append(line)
 
-            if match:
-                ref_raw = match.group(1).upper()
-                val_raw = match.group(2)
-                count = ingest_bom_line(inventory, source_name, ref_raw, val_raw, stats)
-                if count > 0:
-                    stats["parts_found"] += count
-                    success = True
+    return inventory, stats
 
-            if not success:
-                # Fallback: Check if line contains "PCB" (heuristic)
-                if "PCB" in line.upper() and line.strip().upper() != "PCB":
-                    key = f"PCB | {line.strip()}"
-                    inventory[key]["qty"] += 1
-                    if "PCB" not in inventory[key]["sources"][source_name]:
-                        inventory[key]["sources"][source_name].append("PCB")
-                    stats["parts_found"] += 1
-                else:
-                    stats["residuals"].append(line)
 
-    return inventory, stats
+def _open_csv(csv_file: str | IO[str]) -> contextlib.AbstractContextManager[IO[str]]:
+    """Opens a CSV path, or wraps an already-open text stream without closing it."""
+    if isinstance(csv_file, str):
+        return open(csv_file, encoding="utf-8-sig", buffering=_CSV_BUFFER)
+    return contextlib.nullcontext(csv_file)
 
 
-def parse_csv_bom(filepath: str, source_name: str) -> tuple[Inventory, StatsDict]:
+def parse_csv_bom(
+    csv_file: str | IO[str], source_name: str
+) -> tuple[Inventory, StatsDict]:
     """
     Parses a CSV BOM file.
 
@@ -175,60 +294,84 @@ def parse_csv_bom(filepath: str, source_name: str) -> tuple[Inventory, StatsDict
     to using the first two columns.
 
     Args:
-        filepath: Path to the CSV file.
+        csv_file: Path to the CSV file, or an open text stream.
         source_name: Label for the source.
 
     Returns:
         A tuple of (Updated Inventory, Parsing Statistics).
     """
     inventory = create_empty_inventory()
-    stats: StatsDict = {
-        "lines_read": 0,
-        "parts_found": 0,
-        "residuals": [],
-        "extracted_title": None,
-        "seen_refs": set(),
-        "errors": [],
-    }
+    stats = create_empty_stats()
+
+    with _open_csv(csv_file) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        # Resolve column indices once from the header (last duplicate wins)
+        columns = {h.lower().strip(): i for i, h in enumerate(header) if h}
+        ref_cols = [columns[c] for c in _CSV_REF_COLUMNS if c in columns]
+        val_cols = [columns[c] for c in _CSV_VAL_COLUMNS if c in columns]
+
+        # Fallback: Assume Col 1 = Ref, Col 2 = Val
+        if not ref_cols and not val_cols and len(columns) == 2:
+            ref_cols, val_cols = ([i] for i in columns.values())
+
+        # Specialize the common one-column-each layout into a C-level getter
+        pick = None
+        if len(ref_cols) == 1 and len(val_cols) == 1:
+            pick = itemgetter(ref_cols[0], val_cols[0])
+            width = max(ref_cols[0], val_cols[0]) + 1
+
+        # Parts are buffered per key and recorded once the file is read
+        pending: dict[str, list[str]] = {}
 
-    with open(filepath, encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
         for row in reader:
+            if not row:
+                continue
             stats["lines_read"] += 1
-            row_clean = {str(k).lower().strip(): v for k, v in row.items() if k}
-
-            # Try explicit columns
-            ref = (
-                row_clean.get("ref")
-                or row_clean.get("designator")
-                or row_clean.get("part")
-                or row_clean.get("location")
-            )
-            val = (
-                row_clean.get("value")
-                or row_clean.get("val")
-                or row_clean.get("description")
-            )
 
-            # Fallback: Assume Col 1 = Ref, Col 2 = Val
-            if not ref and not val and len(row_clean) == 2:
-                vals = list(row_clean.values())
-                ref = vals[0]
-                val = vals[1]
+            if pick and len(row) >= width:
+                ref, val = pick(row)
+            else:
+                # Try explicit columns (first non-empty candidate wins)
+                ref = next((_cell(row, i) for i in ref_cols if _cell(row, i)), None)
+                val = next((_cell(row, i) for i in val_cols if _cell(row, i)), None)
 
             success = False
             if ref and val:
-                count = ingest_bom_line(inventory, source_name, ref, val, stats)
+                count = ingest_bom_batch(
+                    inventory, source_name, ((ref, val),), stats, pending
+                )
                 if count > 0:
                     stats["parts_found"] += count
                     success = True
 
             if not success:
-                stats["residuals"].append(str(row))
+                stats["residuals"].append(_csv_row_repr(header, row))
+
+        _commit_pending(inventory, source_name, pending)
 
     return inventory, stats
 
 
+def _csv_row_repr(header: list[str], row: list[str]) -> str:
+    """Renders a CSV row as the dict csv.DictReader would have produced."""
+    record: dict[str | None, Any] = dict(zip(header, row, strict=False))
+    if len(row) > len(header):
+        record[None] = row[len(header) :]
+    else:
+        for key in header[len(row) :]:
+            record[key] = None
+    return str(record)
+
+
+def _cell(row: list[str], idx: int | None, default: str = "") -> str:
+    """Returns row[idx], or the default if the column or cell is missing."""
+    if idx is None or idx >= len(row):
+        return default
+    return row[idx]
+
+
 def parse_user_inventory(filepath: str) -> Inventory:
     """
     Parses a user's stock CSV.
@@ -244,14 +387,20 @@ def parse_user_inventory(filepath: str) -> Inventory:
     """
     stock: Inventory = create_empty_inventory()
 
-    with open(filepath, encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            row_clean = {k.lower(): v for k, v in row.items() if k}
+    with open(filepath, encoding="utf-8-sig", newline="", buffering=_CSV_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
 
-            cat = row_clean.get("category", "").strip()
-            val = row_clean.get("part", "").strip()
-            qty_str = row_clean.get("qty", "0").strip()
+        # Map header names to column indices once
+        idx = {h.lower(): i for i, h in enumerate(header) if h}
+        cat_i = idx.get("category")
+        part_i = idx.get("part")
+        qty_i = idx.get("qty")
+
+        for row in reader:
+            cat = _cell(row, cat_i).strip()
+            val = _cell(row, part_i).strip()
+            qty_str = _cell(row, qty_i, "0").strip()
 
             if cat and val:
                 try:
@@ -273,6 +422,7 @@ def _parse_via_tables(
     inventory: Inventory,
     source_name: str,
     stats: StatsDict,
+    pending: dict[str, list[str]] | None = None,
 ) -> None:
     """
     Strategy 1: Extract data using visual table boundaries.
@@ -308,13 +458,16 @@ def _parse_via_tables(
             if loc_idx == -1 or val_idx == -1:
                 loc_idx, val_idx, start_row_idx = 0, 1, 0
 
-            for row in table[start_row_idx:]:
+            rows: list[tuple[str, str]] = []
+            for row in itertools.islice(table, start_row_idx, None):
                 stats["lines_read"] += 1
                 row_safe = [str(cell) if cell else "" for cell in row]
 
                 # Skip Summary lines (e.g., "1 x 100k")
                 first_content = next((c for c in row_safe if c), "")
-                if re.match(r"^\d+\s*[xX]", first_content):
+                if first_content[:1].isdecimal() and _SUMMARY_ROW_RE.match(
+                    first_content
+                ):
                     continue
 
                 ref_raw = ""
@@ -329,11 +482,11 @@ def _parse_via_tables(
                         ref_raw, val_raw = parts[0].strip(), parts[1].strip()
 
                 if ref_raw and val_raw:
-                    count = ingest_bom_line(
-                        inventory, source_name, ref_raw, val_raw, stats
-                    )
-                    if count > 0:
-                        stats["parts_found"] += count
+                    rows.append((ref_raw, val_raw))
+
+            stats["parts_found"] += ingest_bom_batch(
+                inventory, source_name, rows, stats, pending
+            )
 
 
 def _parse_via_regex(
@@ -341,6 +494,7 @@ def _parse_via_regex(
     inventory: Inventory,
     source_name: str,
     stats: StatsDict,
+    pending: dict[str, list[str]] | None = None,
 ) -> None:
     """
     Strategy 2: Fallback extraction using regex pattern matching.
@@ -365,6 +519,7 @@ def _parse_via_regex(
             continue
 
         matches = list(regex.finditer(text))
+        rows: list[tuple[str, str]] = []
 
         for i, match in enumerate(matches):
             ref_str = match.group("ref").upper()
@@ -377,11 +532,8 @@ def _parse_via_regex(
             )
 
             # Expand value capture for multi-word items (Switches, Pots)
-            if (
-                ref_str.startswith("LDR")
-                or ref_str in C.KEYWORDS
-                or ref_str.startswith(("POT", "VR"))
-            ):
+            is_keyword = ref_str in _KEYWORD_SET
+            if is_keyword or ref_str.startswith(("LDR", "POT", "VR")):
                 line_end = text.find("\n", val_start)
                 if line_end == -1:
                     line_end = len(text)
@@ -397,58 +549,74 @@ def _parse_via_regex(
             # Filters
             if len(val_str) > 50 or len(val_str) < 1:
                 continue
-            if any(bad in val_str.upper() for bad in C.IGNORE_VALUES):
+            val_up = val_str.upper()
+            if _IGNORE_VALUES_RE.search(val_up):
                 continue
-            if re.match(r"^(is|see|note)\s", val_str, re.IGNORECASE):
+            if _PROSE_VALUE_RE.match(val_str):
                 continue
-            if re.match(r"^\d{1,2}[\.\-\/]\d{1,2}[\.\-\/]\d{2,4}", val_str):
+            if val_str[:1].isdecimal() and _DATE_VALUE_RE.match(val_str):
                 continue
 
             # Validation
-            is_keyword = ref_str in C.KEYWORDS
             if not is_keyword:
                 # Must start with valid prefix
-                valid_prefixes = C.CORE_PREFIXES + ("POT", "VR", "L", "LD")
-                if not any(ref_str.startswith(p) for p in valid_prefixes):
+                if not ref_str.startswith(_TEXT_REF_PREFIXES):
                     continue
                 # "Ghost Data" check (Qty Part reversed)
-                if len(ref_str) >= 3 and re.match(r"^\d+$", val_str):
+                if len(ref_str) >= 3 and val_str.isdecimal():
                     continue
             else:
                 # Keyword validation
-                has_digit = any(char.isdigit() for char in val_str)
-                is_switch = any(
-                    x in val_str.upper()
-                    for x in ["SPDT", "DPDT", "3PDT", "ON/ON", "ON/OFF"]
-                )
+                has_digit = not _DIGITS.isdisjoint(val_str)
+                is_switch = bool(_SWITCH_TOKENS_RE.search(val_up))
                 if not has_digit and not is_switch:
                     continue
 
                 # Semantic Check (e.g., prevent "LOOP" -> "IC")
-                val_up = val_str.upper()
-                bad_starts = (
-                    "IC",
-                    "DIP",
-                    "SOIC",
-                    "PKG",
-                    "MODULE",
-                    "PCB",
-                    "TL",
-                    "OP",
-                    "NE5",
-                )
                 is_package = "DIP" in val_up or "SOIC" in val_up
-                if any(val_up.startswith(x) for x in bad_starts) or (
+                if val_up.startswith(_KEYWORD_BAD_STARTS) or (
                     is_package and not has_digit
                 ):
                     continue
 
-            c = ingest_bom_line(inventory, source_name, ref_str, val_str, stats)
-            if c > 0:
-                stats["parts_found"] += c
+            rows.append((ref_str, val_str))
 
+        stats["parts_found"] += ingest_bom_batch(
+            inventory, source_name, rows, stats, pending
+        )
 
-def parse_pedalpcb_pdf(filepath: str, source_name: str) -> tuple[Inventory, StatsDict]:
+
+def _extract_title(page: Any, stats: StatsDict) -> None:
+    """
+    Guesses the project title from the largest text on the first page.
+
+    Title extraction is heuristic/optional; failures are swallowed so they
+    never fail the build.
+
+    Args:
+        page: The first pdfplumber page.
+        stats: The statistics dictionary; 'extracted_title' is set on success.
+    """
+    try:
+        words = page.extract_words(extra_attrs=["size"])
+        candidates = [
+            w
+            for w in words
+            if w["text"].upper() not in _TITLE_IGNORE_WORDS and w["size"] > 10
+        ]
+
+        if candidates:
+            max_size = max(c["size"] for c in candidates)
+            title_words = [w for w in candidates if w["size"] >= max_size - 1]
+            title_words.sort(key=itemgetter("top", "x0"))
+            stats["extracted_title"] = " ".join(w["text"] for w in title_words)
+    except Exception:
+        pass
+
+
+def parse_pedalpcb_pdf(
+    pdf_file: str | BytesIO, source_name: str
+) -> tuple[Inventory, StatsDict]:
     """
     Parses a PedalPCB Build Document (PDF).
 
@@ -457,7 +625,7 @@ def parse_pedalpcb_pdf(filepath: str, source_name: str) -> tuple[Inventory, Stat
     2. Text-based heuristic layout analysis (Regex fallback).
 
     Args:
-        filepath: Path to the PDF file.
+        pdf_file: Path to the PDF file, or its bytes wrapped in a BytesIO.
         source_name: Label for the source.
 
     Returns:
@@ -468,31 +636,19 @@ def parse_pedalpcb_pdf(filepath: str, source_name: str) -> tuple[Inventory, Stat
         import pdfplumber
     except ImportError:
         logger.error("pdfplumber not installed.")
-        return create_empty_inventory(), {
-            "lines_read": 0,
-            "parts_found": 0,
-            "residuals": [],
-            "extracted_title": None,
-            "seen_refs": set(),
-            "errors": ["Missing dependency: pdfplumber"],
-        }
+        return create_empty_inventory(), create_empty_stats(
+            "Missing dependency: pdfplumber"
+        )
 
     inventory = create_empty_inventory()
-    stats: StatsDict = {
-        "lines_read": 0,
-        "parts_found": 0,
-        "residuals": [],
-        "extracted_title": None,
-        "seen_refs": set(),
-        "errors": [],
-    }
+    stats = create_empty_stats()
 
     pdf = None
     try:
         # Phase 1: File Access
         # We isolate this to distinguish between "Bad File" and "Bad Code"
         try:
-            pdf = pdfplumber.open(filepath)
+            pdf = pdfplumber.open(pdf_file)
         except Exception as e:
             logger.error(f"Failed to open PDF {source_name}: {e}")
             stats["errors"].append(f"File Error: {str(e)}")
@@ -500,48 +656,30 @@ def parse_pedalpcb_pdf(filepath: str, source_name: str) -> tuple[Inventory, Stat
 
         # Phase 2: Extraction
         try:
-            # Iterate pages once to grab expensive text/table data
+            # Iterate pages once to grab expensive text/table data (and the
+            # title from page 1 while its layout is already parsed)
             pages_data = []
-            for page in pdf.pages:
-                pages_data.append(
-                    {"tables": page.extract_tables(), "text": page.extract_text()}
+            for page_no, page in enumerate(pdf.pages):
+                if page_no == 0:
+                    _extract_title(page, stats)
+
+                # Skip the expensive table finder on pages with no ruled table
+                tables = (
+                    page.extract_tables() if len(page.edges) >= _MIN_TABLE_EDGES else []
                 )
+                pages_data.append({"tables": tables, "text": page.extract_text()})
 
-            # --- PHASE 2: TITLE EXTRACTION ---
+            # Both strategies buffer parts; recorded once (even on failure)
+            pending: dict[str, list[str]] = {}
             try:
-                p1 = pdf.pages[0]
-                words = p1.extract_words(extra_attrs=["size"])
-                ignore = {
-                    "PEDALPCB",
-                    "CONTROLS",
-                    "REVISION",
-                    "COPYRIGHT",
-                    "WWW.PEDALPCB.COM",
-                    "LEVEL",
-                    "VCC",
-                    "GND",
-                }
-                candidates = [
-                    w
-                    for w in words
-                    if w["text"].upper() not in ignore and w["size"] > 10
-                ]
-
-                if candidates:
-                    max_size = max(c["size"] for c in candidates)
-                    title_words = [w for w in candidates if w["size"] >= max_size - 1]
-                    title_words.sort(key=lambda x: (x["top"], x["x0"]))
-                    stats["extracted_title"] = " ".join(w["text"] for w in title_words)
-            except Exception:
-                # Title extraction is heuristic/optional; don't fail the build if it misses.
-                pass
-
-            # --- STRATEGY 1: TABLE EXTRACTION ---
-            _parse_via_tables(pages_data, inventory, source_name, stats)
-
-            # --- STRATEGY 2: REGEX FALLBACK ---
-            # Automatically adjusts strictness based on whether tables were found
-            _parse_via_regex(pages_data, inventory, source_name, stats)
+                # --- STRATEGY 1: TABLE EXTRACTION ---
+                _parse_via_tables(pages_data, inventory, source_name, stats, pending)
+
+                # --- STRATEGY 2: REGEX FALLBACK ---
+                # Automatically adjusts strictness based on whether tables were found
+                _parse_via_regex(pages_data, inventory, source_name, stats, pending)
+            finally:
+                _commit_pending(inventory, source_name, pending)
 
         except Exception as e:
             # Capture internal parsing errors (logic bugs, layout changes)
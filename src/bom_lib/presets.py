@@ -3,6 +3,7 @@ src/bom_lib/presets.py
 Logic for querying and managing BOM presets.
 """
 
+import functools
 import re
 from collections import defaultdict
 from typing import Any
@@ -12,12 +13,21 @@ try:
 except ImportError:
     BOM_PRESETS = {}
 
+# Regex to handle "[Source] [Category] Name" or "[Source] Name"
+_PRESET_KEY_RE = re.compile(r"^\[(.*?)\] (?:\[(.*?)\] )?(.*)$")
 
+
+@functools.cache
 def get_preset_metadata() -> tuple[
     list[str], dict[str, list[str]], list[dict[str, Any]]
 ]:
     """
     Parses BOM_PRESETS keys into a queryable structure.
+
+    BOM_PRESETS is fixed at import, so the result is computed once and
+    shared between callers (the UI renders it for every slot on every
+    rerun). Treat the returned containers as read-only.
+
     Returns:
         sources (list): Unique sources (e.g., 'PedalPCB', 'Tayda')
         categories (dict): Map of Source -> List of Categories
@@ -27,11 +37,8 @@ def get_preset_metadata() -> tuple[
     sources = set()
     categories = defaultdict(set)
 
-    # Regex to handle "[Source] [Category] Name" or "[Source] Name"
-    pattern = re.compile(r"^\[(.*?)\] (?:\[(.*?)\] )?(.*)$")
-
     for key in BOM_PRESETS:
-        match = pattern.match(key)
+        match = _PRESET_KEY_RE.match(key)
         if match:
             src = match.group(1)
             cat = match.group(2) or "Misc"
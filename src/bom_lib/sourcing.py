@@ -8,14 +8,72 @@ This module contains the "Nerd Economics" logic, which includes:
 - Identifying missing or residual parts from parsing.
 """
 
-import math
+import bisect
+import functools
 import re
+from collections.abc import Callable, Iterable
 from urllib.parse import quote_plus
 
 import src.bom_lib.constants as C
 from src.bom_lib.types import Inventory, StatsDict
 from src.bom_lib.utils import float_to_search_string, parse_value_to_float
 
+# Inventory keys checked for injection warnings
+_SMD_ADAPTER_KEY = "Hardware/Misc | SMD_ADAPTER_BOARD"
+_DIP_SOCKET_KEY = "Hardware/Misc | 8 PIN DIP SOCKET"
+
+# Residual lines matching these are section headers, not missed parts
+_RESIDUAL_HEADER_RE = re.compile(
+    "RESISTORS|CAPACITORS|TRANSISTORS|DIODES|POTENTIOMETERS|PCB|COMPONENT LIST|SOCKET"
+)
+
+# ASCII digits, for set-based "contains a digit" checks
+_DIGITS = frozenset("0123456789")
+
+
+def _format_alts_note(alts: Iterable[tuple[str, ...]]) -> str:
+    """Renders a substitution table entry as a '💡 TRY: ...' note."""
+    txt_parts = [
+        f"{item[0]} ({item[1]}{': ' + item[2] if len(item) > 2 else ''})"
+        for item in alts
+    ]
+    return f"💡 TRY: {', '.join(txt_parts)}"
+
+
+# Pot value cleanup ("B100k" -> "100k") and DIP package suffixes ("TL072CP")
+_POT_CLEAN_RE = re.compile(rf"[{''.join(C.POT_TAPER_MAP.keys())}\-\s]")
+_IC_PACKAGE_SUFFIXES = ("CP", "CN", "P", "N")
+
+# Purchasing rules, unpacked once so get_buy_details does no config lookups
+_RES_RULES = C.PURCHASING_CONFIG["Resistors"]
+_RES_BUFFER = _RES_RULES["buffer_add"]
+_RES_ROUND_TO = _RES_RULES["round_to"]
+_RES_NOTE = _RES_RULES["note"]
+_RES_SUSPICIOUS_LOW = _RES_RULES["suspicious_threshold_low"]
+
+_CAP_RULES = C.PURCHASING_CONFIG["Capacitors"]
+_CAP_BULK_F = _CAP_RULES["bulk_threshold"]
+_CAP_BULK_BUFFER = _CAP_RULES["bulk_buffer"]
+_CAP_STANDARD_BUFFER = _CAP_RULES["standard_buffer"]
+_CAP_LARGE_F = _CAP_RULES["large_threshold"]
+_CAP_LARGE_BUFFER = _CAP_RULES["large_buffer"]
+_CAP_SUSPICIOUS_HIGH = _CAP_RULES["suspicious_threshold_high"]
+
+# Slack for comparing parsed capacitances against exact values
+_FARAD_TOLERANCE = 1.0e-9
+
+# Capacitor dielectric bands (Farads), searched with bisect:
+# < 1nF -> Ceramic/MLCC, 1nF to 1uF (inclusive, with float slack) -> Film,
+# > 1uF -> Electrolytic
+_CAP_SPEC_THRESHOLDS = (1.0e-9, 1.0e-6 + 1.0e-9)
+_CAP_SPEC_TYPES = ("MLCC", "Box Film", "Electrolytic")
+
+# The substitution tables are static, so render their notes once at import
+_IC_ALT_NOTES = {name: _format_alts_note(alts) for name, alts in C.IC_ALTS.items()}
+_DIODE_ALT_NOTES = {
+    name: _format_alts_note(alts) for name, alts in C.DIODE_ALTS.items()
+}
+
 
 def get_residual_report(stats: StatsDict) -> list[str]:
     """
@@ -30,29 +88,18 @@ def get_residual_report(stats: StatsDict) -> list[str]:
     Returns:
         A list of suspicious lines that might require manual review.
     """
-    safe_words = [
-        "RESISTORS",
-        "CAPACITORS",
-        "TRANSISTORS",
-        "DIODES",
-        "POTENTIOMETERS",
-        "PCB",
-        "COMPONENT LIST",
-        "SOCKET",
-    ]
     suspicious: list[str] = []
 
     for line in stats["residuals"]:
+        upper = line.upper()
+
         # Pass explicit errors/exceptions through
-        if "ERROR" in line.upper() or "EXCEPTION" in line.upper():
+        if "ERROR" in upper or "EXCEPTION" in upper:
             suspicious.append(line)
             continue
 
-        upper = line.upper()
-        is_header = any(w in upper for w in safe_words)
-
         # If it's not a header but has numbers, it might be a missed part
-        if not is_header and any(c.isdigit() for c in line):
+        if not _RESIDUAL_HEADER_RE.search(upper) and not _DIGITS.isdisjoint(line):
             suspicious.append(line)
 
     return suspicious
@@ -69,17 +116,26 @@ def get_injection_warnings(inventory: Inventory) -> list[str]:
         A list of warning strings (e.g., checking SMD adapters).
     """
     warnings = []
-    if inventory["Hardware/Misc | SMD_ADAPTER_BOARD"]["qty"] > 0:
+    if inventory.qty(_SMD_ADAPTER_KEY) > 0:
         warnings.append(
             "⚠️  SMD ADAPTERS: Added for MMBF5457. Check if your PCB has SOT-23 pads first."
         )
-    if inventory["Hardware/Misc | 8 PIN DIP SOCKET"]["qty"] > 0:
+    if inventory.qty(_DIP_SOCKET_KEY) > 0:
         warnings.append(
             "ℹ️  IC SOCKETS: Added sockets for chips. Optional but recommended."
         )
     return warnings
 
 
+def _strip_ic_package(val: str) -> str:
+    """Drops a DIP package suffix ("TL072CP" -> "TL072"), longest first."""
+    for suffix in _IC_PACKAGE_SUFFIXES:
+        if val.endswith(suffix):
+            return val[: -len(suffix)]
+    return val
+
+
+@functools.lru_cache(maxsize=1024)
 def get_spec_type(category: str, val: str) -> str:
     """
     Determines the specific capacitor dielectric or material type.
@@ -100,21 +156,12 @@ def get_spec_type(category: str, val: str) -> str:
         if fval is None:
             return ""
 
-        # <= 1nF -> Ceramic/MLCC
-        if fval < 1.0e-9:
-            return "MLCC"
-
-        # 1nF to 1uF -> Film
-        elif 1.0e-9 <= fval < 1.0e-6 or abs(fval - 1.0e-6) < 1.0e-9:
-            return "Box Film"
-
-        # > 1uF -> Electrolytic
-        else:
-            return "Electrolytic"
+        return _CAP_SPEC_TYPES[bisect.bisect_right(_CAP_SPEC_THRESHOLDS, fval)]
 
     return ""
 
 
+@functools.lru_cache(maxsize=1024)
 def generate_search_term(category: str, val: str, spec_type: str = "") -> str:
     """
     Generates a supplier-optimized search string.
@@ -154,8 +201,7 @@ def generate_search_term(category: str, val: str, spec_type: str = "") -> str:
                 break
 
         # Clean "B100k" -> "100k"
-        taper_chars = "".join(C.POT_TAPER_MAP.keys())
-        clean_raw = re.sub(rf"[{taper_chars}\-\s]", "", val_upper)
+        clean_raw = _POT_CLEAN_RE.sub("", val_upper)
         fval = parse_value_to_float(clean_raw)
 
         if fval is not None:
@@ -180,6 +226,7 @@ def generate_search_term(category: str, val: str, spec_type: str = "") -> str:
     return val
 
 
+@functools.lru_cache(maxsize=1024)
 def generate_tayda_url(search_term: str) -> str:
     """Generates a clickable search URL for Tayda Electronics."""
     if not search_term:
@@ -188,6 +235,7 @@ def generate_tayda_url(search_term: str) -> str:
     return f"https://www.taydaelectronics.com/catalogsearch/result/?q={encoded}"
 
 
+@functools.lru_cache(maxsize=1024)
 def generate_pedalpcb_url(search_term: str) -> str:
     """Generates a clickable search URL for PedalPCB."""
     if not search_term:
@@ -197,6 +245,112 @@ def generate_pedalpcb_url(search_term: str) -> str:
     return f"https://www.pedalpcb.com/?product_cat=&s={encoded}&post_type=product"
 
 
+def _buy_resistors(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """Buffers and rounds up to the next pack size."""
+    # Integer ceiling division (no float round-trip)
+    buy = -(-(count + _RES_BUFFER) // _RES_ROUND_TO) * _RES_ROUND_TO
+
+    note = _RES_NOTE
+    if fval is not None and fval < _RES_SUSPICIOUS_LOW:
+        note = "⚠️ Suspicious Value (< 1Ω). Verify BOM."
+    return buy, note
+
+
+def _buy_optoelectronics(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """One spare for fragile legs."""
+    return count + 1, ""
+
+
+def _buy_capacitors(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """Buffers by capacitance band and recommends a dielectric."""
+    note_parts: list[str] = []
+    buffer = _CAP_STANDARD_BUFFER
+
+    # Bypass caps (100nF) -> Bulk buy
+    if fval is not None and abs(fval - _CAP_BULK_F) < _FARAD_TOLERANCE:
+        buffer = _CAP_BULK_BUFFER
+        note_parts.append("Power filtering (buy bulk).")
+    # Large caps (> 1uF) -> Low buffer
+    elif fval is not None and fval >= _CAP_LARGE_F:
+        buffer = _CAP_LARGE_BUFFER
+
+    buy = count + buffer
+    if fval is not None and fval > _CAP_SUSPICIOUS_HIGH:
+        note_parts.append("⚠️ Suspicious Value (> 10mF).")
+
+    spec_type = get_spec_type("Capacitors", val)
+    if spec_type:
+        if (
+            spec_type == "Box Film"
+            and fval is not None
+            and abs(fval - _CAP_LARGE_F) < _FARAD_TOLERANCE
+        ):
+            note_parts.append("Rec: Box Film (Check BOM: Could be Electrolytic)")
+        elif spec_type == "MLCC":
+            note_parts.append("Rec: Class 1 Ceramic (C0G / NP0)")
+        else:
+            note_parts.append(f"Rec: {spec_type}")
+    return buy, " | ".join(note_parts)
+
+
+def _buy_diodes(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """Minimum pack of ten, with substitution suggestions."""
+    return max(10, count + 5), _DIODE_ALT_NOTES.get(val, "")
+
+
+def _buy_transistors(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """One spare, flagging obsolete and SMD-only parts."""
+    note = ""
+    val_upper = val.upper()
+    if "2N5457" in val_upper:
+        note = "⚠️ Obsolete part! Check for speciality vendors or consider MMBF5457."
+    elif "MMBF" in val_upper:
+        note = "SMD Part! Verify PCB pads or buy adapter."
+    return count + 1, note
+
+
+def _buy_ics(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """Exact count, recommending sockets and op-amp alternatives."""
+    note = "Socket Recommended"
+    clean_ic = _strip_ic_package(val)
+    if clean_ic in _IC_ALT_NOTES:
+        note += f" | {_IC_ALT_NOTES[clean_ic]}"
+    return count, note
+
+
+def _buy_crystals(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """One spare for fragile parts."""
+    return count + 1, "Heat sensitive / Fragile"
+
+
+def _buy_hardware(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """One spare for auto-injected adapters and sockets."""
+    if "ADAPTER" in val:
+        return count + 1, "[AUTO] Verify PCB pads."
+    if "SOCKET" in val:
+        return count + 1, "[AUTO] For chip safety."
+    return count, ""
+
+
+def _buy_pcb(val: str, count: int, fval: float | None) -> tuple[int, str]:
+    """Exact count."""
+    return count, "Main Board"
+
+
+# Per-category purchasing rules; unlisted categories buy the exact count
+_BUY_HANDLERS: dict[str, Callable[[str, int, float | None], tuple[int, str]]] = {
+    "Resistors": _buy_resistors,
+    "Optoelectronics": _buy_optoelectronics,
+    "Capacitors": _buy_capacitors,
+    "Diodes": _buy_diodes,
+    "Transistors": _buy_transistors,
+    "ICs": _buy_ics,
+    "Crystals/Oscillators": _buy_crystals,
+    "Hardware/Misc": _buy_hardware,
+    "PCB": _buy_pcb,
+}
+
+
 def get_buy_details(
     category: str, val: str, count: int, fval: float | None = None
 ) -> tuple[int, str]:
@@ -219,106 +373,15 @@ def get_buy_details(
     if count <= 0:
         return 0, ""
 
-    buy = count
-    note = ""
+    handler = _BUY_HANDLERS.get(category)
+    if handler is None:
+        return count, ""
 
     # Fallback if fval wasn't passed (for backward compatibility or tests)
     if fval is None:
         fval = parse_value_to_float(val)
 
-    if category == "Resistors":
-        rules = C.PURCHASING_CONFIG["Resistors"]
-
-        buffered_qty = count + rules["buffer_add"]
-        round_step = rules["round_to"]
-        buy = math.ceil(buffered_qty / round_step) * round_step
-
-        note = rules["note"]
-        if fval is not None and fval < rules["suspicious_threshold_low"]:
-            note = "⚠️ Suspicious Value (< 1Ω). Verify BOM."
-
-    elif category == "Optoelectronics":
-        buy = count + 1  # Fragile legs
-
-    elif category == "Capacitors":
-        note_parts: list[str] = []
-        buffer = 5
-
-        # Bypass caps (100nF) -> Bulk buy
-        if fval is not None and abs(fval - 1.0e-7) < 1.0e-9:
-            buffer = 10
-            note_parts.append("Power filtering (buy bulk).")
-        # Large caps (> 1uF) -> Low buffer
-        elif fval is not None and fval >= 1.0e-6:
-            buffer = 1
-
-        buy = count + buffer
-        if fval is not None and fval > 0.01:
-            note_parts.append("⚠️ Suspicious Value (> 10mF).")
-
-        spec_type = get_spec_type(category, val)
-        if spec_type:
-            if (
-                spec_type == "Box Film"
-                and fval is not None
-                and abs(fval - 1.0e-6) < 1.0e-9
-            ):
-                note_parts.append("Rec: Box Film (Check BOM: Could be Electrolytic)")
-            elif spec_type == "MLCC":
-                note_parts.append("Rec: Class 1 Ceramic (C0G / NP0)")
-            else:
-                note_parts.append(f"Rec: {spec_type}")
-        note = " | ".join(note_parts)
-
-    elif category == "Diodes":
-        buy = max(10, count + 5)
-        # Check substitutions
-        if val in C.DIODE_ALTS:
-            alts = C.DIODE_ALTS[val]
-            txt_parts = [
-                f"{item[0]} ({item[1]}{': ' + item[2] if len(item) > 2 else ''})"
-                for item in alts
-            ]
-            note = f"💡 TRY: {', '.join(txt_parts)}"
-
-    elif category == "Transistors":
-        buy = count + 1
-        if "2N5457" in val.upper():
-            note = "⚠️ Obsolete part! Check for speciality vendors or consider MMBF5457."
-        elif "MMBF" in val.upper():
-            note = "SMD Part! Verify PCB pads or buy adapter."
-
-    elif category == "ICs":
-        buy = count
-        note = "Socket Recommended"
-        clean_ic = re.sub(r"(CP|CN|P|N)$", "", val)
-        if clean_ic in C.IC_ALTS:
-            alts = C.IC_ALTS[clean_ic]
-            txt_parts = [
-                f"{item[0]} ({item[1]}{': ' + item[2] if len(item) > 2 else ''})"
-                for item in alts
-            ]
-            note += f" | 💡 TRY: {', '.join(txt_parts)}"
-
-    elif category == "Crystals/Oscillators":
-        buy = count + 1
-        note = "Heat sensitive / Fragile"
-
-    elif category == "Hardware/Misc":
-        if "ADAPTER" in val or "SOCKET" in val:
-            buy = count + 1
-            note = (
-                "[AUTO] Verify PCB pads."
-                if "ADAPTER" in val
-                else "[AUTO] For chip safety."
-            )
-        else:
-            buy = count
-
-    elif category == "PCB":
-        note = "Main Board"
-
-    return buy, note
+    return handler(val, count, fval)
 
 
 def get_standard_hardware(inventory: Inventory, pedal_count: int = 1) -> None:
@@ -345,16 +408,27 @@ def get_standard_hardware(inventory: Inventory, pedal_count: int = 1) -> None:
             qty_override if qty_override is not None else (qty_per_pedal * pedal_count)
         )
 
-        inventory[key]["qty"] += total_qty
-        inventory[key]["refs"].append("HW")
-        inventory[key]["sources"]["Auto-Inject"].append(f"Auto-Inject ({note})")
+        part = inventory[key]
+        part["qty"] += total_qty
+        part["refs"].append("HW")
+        part["sources"]["Auto-Inject"].append(f"Auto-Inject ({note})")
+
+    # Survey the BOM in one pass before injecting. Nothing injected below
+    # is a PCB or a potentiometer, so the results stay valid throughout.
+    has_fuzz_pcb = False
+    total_pots = 0
+    for k, d in inventory.items():
+        if k.startswith("Potentiometers"):
+            total_pots += d["qty"]
+        elif not has_fuzz_pcb and k.startswith("PCB"):
+            has_fuzz_pcb = "FUZZ" in k.upper()
 
     # 1. Smart Merges (Add to existing categories)
     inject("Resistors", "3.3k", 1, "LED CLR")
     inject("Diodes", "LED", 1, "Status Light")
 
     # 2. Germanium Heuristic (Fuzz check)
-    if any("FUZZ" in k.upper() for k in inventory if k.startswith("PCB")):
+    if has_fuzz_pcb:
         inject("Transistors", "Germanium PNP", 0, "Vintage Option")
 
     # 3. Standard Enclosure Hardware
@@ -371,9 +445,6 @@ def get_standard_hardware(inventory: Inventory, pedal_count: int = 1) -> None:
     inject("Hardware/Misc", "Heat Shrink Tubing", 1, "Insulation")
 
     # 4. Potentiometer Hardware (Knobs/Seals)
-    total_pots = sum(
-        d["qty"] for k, d in inventory.items() if k.startswith("Potentiometers")
-    )
     if total_pots > 0:
         inject(
             "Hardware/Misc", "Knob", 0, f"Knobs ({total_pots})", qty_override=total_pots
@@ -96,6 +96,11 @@ class Inventory(UserDict):
         self.data[key] = value
         return value
 
+    def qty(self, key: str) -> int:
+        """Returns the quantity recorded for key, without creating an entry."""
+        part = self.data.get(key)
+        return part["qty"] if part is not None else 0
+
     def add_part(self, source: str, key: str, ref: str, qty: int = 1) -> None:
         """
         Records a part in the inventory.
@@ -106,7 +111,33 @@ class Inventory(UserDict):
             ref: The reference designator (e.g., "R1").
             qty: Quantity to add.
         """
-        part = self[key]
+        part = self._entry(key)
+        part["qty"] += qty
+
+        if ref:
+            part["refs"].append(ref)
+            part["sources"][source].append(ref)
+
+    def add_parts(self, source: str, key: str, refs: list[str]) -> None:
+        """
+        Records one unit per reference for a single component key.
+
+        Equivalent to calling add_part() for each ref, but extends the
+        ref lists once per batch instead of appending per reference.
+
+        Args:
+            source: Source identifier (e.g., "Big Muff").
+            key: The unique component key (e.g., "Resistors | 10k").
+            refs: The reference designators (e.g., ["R1", "R2"]).
+        """
+        part = self._entry(key)
+        part["qty"] += len(refs)
+        part["refs"].extend(refs)
+        part["sources"][source].extend(refs)
+
+    def _entry(self, key: str) -> PartData:
+        """Returns the part entry, priming the cached float for new parts."""
+        part: PartData = self[key]
 
         # Initialize cached float if this is a new part entry
         if part["qty"] == 0:
@@ -116,11 +147,7 @@ class Inventory(UserDict):
             else:
                 part["val_float"] = None
 
-        part["qty"] += qty
-
-        if ref:
-            part["refs"].append(ref)
-            part["sources"][source].append(ref)
+        return part
 
     def merge(self, other: "Inventory", multiplier: int = 1) -> None:
         """
@@ -131,12 +158,33 @@ class Inventory(UserDict):
             multiplier: Multiplication factor for the incoming inventory quantities.
         """
         for key, data in other.items():
-            self[key]["qty"] += data["qty"] * multiplier
-            self[key]["refs"].extend(data["refs"])
+            part = self[key]
+            part["qty"] += data["qty"] * multiplier
+            part["refs"].extend(data["refs"])
             for src, refs in data["sources"].items():
-                self[key]["sources"][src].extend(refs * multiplier)
+                # Extend in place rather than building a refs * multiplier copy
+                dst = part["sources"][src]
+                for _ in range(multiplier):
+                    dst.extend(refs)
 
 
 def create_empty_inventory() -> Inventory:
     """Factory function to return new Inventory instance."""
     return Inventory()
+
+
+def create_empty_stats(*errors: str) -> StatsDict:
+    """
+    Factory function to return a fresh StatsDict.
+
+    Args:
+        *errors: Optional error messages to pre-populate (e.g. for early exits).
+    """
+    return {
+        "lines_read": 0,
+        "parts_found": 0,
+        "residuals": [],
+        "extracted_title": None,
+        "seen_refs": set(),
+        "errors": list(errors),
+    }
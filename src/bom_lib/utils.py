@@ -8,11 +8,28 @@ This module handles the low-level formatting logic, including:
 - Search string generation (1500.0 -> 1.5k).
 """
 
+import functools
 import re
 from typing import Any
 
 from src.bom_lib import constants as C
 
+# SI scales used when rendering floats back to engineering strings
+_LARGE_SCALES = (("M", 1e6), ("k", 1e3))
+_SMALL_SCALES = (("u", 1e-6), ("n", 1e-9), ("p", 1e-12))
+
+# Compiled once at import; these run per ref/value on the inventory hot path
+_NAT_SPLIT_RE = re.compile(r"(\d+)")
+_VALUE_RE = re.compile(
+    r"(?P<whole>\d+)(?P<sfx>[pnumkKMG])(?P<frac>\d+)"
+    r"|(?P<num>[\d\.]+)\s*(?P<unit>[pnumkKMG])?"
+)
+_DECIMAL_SI_RE = re.compile(r"(\d+)\.(\d+)([a-zA-Z]+)")
+_CLEAN_NAME_RE = re.compile(r"^\[(.*?)\] (?:\[(.*?)\] )?(.*)$")
+
+# Folds MICRO SIGN (U+00B5) and GREEK SMALL LETTER MU (U+03BC) to ASCII 'u'
+_MICRO_TO_ASCII = str.maketrans({"\u00b5": "u", "\u03bc": "u"})
+
 
 def natural_sort_key(ref: str) -> list[Any]:
     """
@@ -29,10 +46,16 @@ def natural_sort_key(ref: str) -> list[Any]:
     """
     return [
         int(text) if text.isdigit() else text.upper()
-        for text in re.split(r"(\d+)", ref)
+        for text in _NAT_SPLIT_RE.split(ref)
     ]
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_sort_key(ref: str) -> tuple[Any, ...]:
+    """Immutable, memoized form of natural_sort_key for repeated refs."""
+    return tuple(natural_sort_key(ref))
+
+
 def deduplicate_refs(refs: list[str]) -> list[str]:
     """
     Removes duplicates and applies natural sorting to a reference list.
@@ -46,8 +69,51 @@ def deduplicate_refs(refs: list[str]) -> list[str]:
     if not refs:
         return []
 
-    unique = list(set(refs))
-    return sorted(unique, key=natural_sort_key)
+    # dict.fromkeys keeps first-seen order, so refs that differ only in
+    # case ('r1' vs 'R1') tie-break deterministically across runs.
+    return sorted(dict.fromkeys(refs), key=_cached_sort_key)
+
+
+def _scan_ref_range(ref: str) -> tuple[str, int, int] | None:
+    """
+    Splits a range like 'R1-R4' or 'R1-4' into ('R', 1, 4).
+
+    A hand-rolled scanner equivalent to matching
+    ``([A-Z]+)(\\d+)-([A-Z]+)?(\\d+)`` at the start of the string.
+
+    Args:
+        ref: The stripped reference string.
+
+    Returns:
+        A (prefix, start, end) tuple, or None if the string is not a range.
+    """
+    n = len(ref)
+
+    # Prefix letters
+    i = 0
+    while i < n and "A" <= ref[i] <= "Z":
+        i += 1
+    if i == 0:
+        return None
+
+    # Start number, then the dash
+    j = i
+    while j < n and ref[j].isdecimal():
+        j += 1
+    if j in (i, n) or ref[j] != "-":
+        return None
+
+    # Optional repeated prefix, then the end number
+    k = j + 1
+    while k < n and "A" <= ref[k] <= "Z":
+        k += 1
+    m = k
+    while m < n and ref[m].isdecimal():
+        m += 1
+    if m == k:
+        return None
+
+    return ref[:i], int(ref[i:j]), int(ref[k:m])
 
 
 def expand_refs(ref_raw: str) -> list[str]:
@@ -64,41 +130,32 @@ def expand_refs(ref_raw: str) -> list[str]:
         A list of individual references (e.g., ['R1', 'R2', 'R3', 'R4']).
         Returns the original string as a single-item list if expansion fails.
     """
-    refs = []
     ref_raw = ref_raw.strip()
 
-    if "-" in ref_raw:
-        try:
-            # Captures: Prefix1, StartNum, Prefix2(Optional), EndNum
-            m = re.match(r"([A-Z]+)(\d+)-([A-Z]+)?(\d+)", ref_raw)
-            if m:
-                prefix = m.group(1)
-                start = int(m.group(2))
-                end = int(m.group(4))
-
-                # Sanity check: Avoid accidental explosion of "1990-2000" dates
-                if (end - start) < 50:
-                    for i in range(start, end + 1):
-                        refs.append(f"{prefix}{i}")
-                else:
-                    refs.append(ref_raw)
-            else:
-                refs.append(ref_raw)
-        except Exception:
-            # On any regex/parsing error, treat as a literal string
-            refs.append(ref_raw)
-    else:
-        refs.append(ref_raw)
-
-    return refs
+    if "-" not in ref_raw:
+        return [ref_raw]
+
+    span = _scan_ref_range(ref_raw)
+    if span is None:
+        return [ref_raw]
+
+    prefix, start, end = span
+
+    # Sanity check: Avoid accidental explosion of "1990-2000" dates
+    if (end - start) >= 50:
+        return [ref_raw]
 
+    return [f"{prefix}{i}" for i in range(start, end + 1)]
 
+
+@functools.lru_cache(maxsize=4096)
 def parse_value_to_float(val_str: str) -> float | None:
     """
     Reduces component values to their base SI unit (Ohms/Farads).
 
     Handles standard notation ('10k', '4.7u') and BS 1852 "sandwich"
-    notation ('1k5').
+    notation ('1k5'). Results are memoized: BOMs repeat a small set of
+    values ("10k", "100n") and this is called from sort keys.
 
     Args:
         val_str: The raw value string (e.g., "4k7").
@@ -109,42 +166,44 @@ def parse_value_to_float(val_str: str) -> float | None:
     if not val_str:
         return None
 
-    val_str = val_str.strip()
-
-    # Strategy 1: "Sandwich" notation (BS 1852): 1k5 -> 1500.0
-    # Match: (Digits)(Multiplier)(Digits)
-    sandwich = re.match(r"^(\d+)([pnuµmkKMG])(\d+)", val_str)
-
-    if sandwich:
-        whole = sandwich.group(1)
-        suffix = sandwich.group(2)
-        fraction = sandwich.group(3)
+    val_str = val_str.strip().translate(_MICRO_TO_ASCII)
+
+    # Fast path: plain integers ("100") and simple suffixed values ("10k",
+    # "4.7u") resolve without touching the regex engine.
+    if val_str.isdecimal():
+        return float(val_str)
+
+    suffix = val_str[-1:]
+    if suffix in C.MULTIPLIERS:
+        head = val_str[:-1].rstrip()
+        if head.replace(".", "").isdecimal():
+            try:
+                return float(head) * C.MULTIPLIERS[suffix]
+            except ValueError:
+                pass
+
+    # One pattern, two alternatives tried in order:
+    # 1. "Sandwich" notation (BS 1852): (Digits)(Multiplier)(Digits), 1k5 -> 1500.0
+    # 2. Standard "Number + Suffix": (Start)(Number)(Multiplier?)(Everything Else)
+    match = _VALUE_RE.match(val_str)
+    if not match:
+        return None
 
+    whole = match.group("whole")
+    if whole is not None:
         # Reassemble as float: 1k5 -> 1.5 * multiplier
-        base = float(f"{whole}.{fraction}")
-        return base * C.MULTIPLIERS[suffix]
+        base = float(f"{whole}.{match.group('frac')}")
+        return base * C.MULTIPLIERS[match.group("sfx")]
 
-    # Strategy 2: Standard "Number + Suffix"
-    # Match: (Start)(Number)(Multiplier?)(Everything Else)
-    match = re.search(r"^([\d\.]+)\s*([pnuµmkKMG])?", val_str)
-
-    if match:
-        num_str = match.group(1)
-        suffix = match.group(2)
-
-        try:
-            base_val = float(num_str)
-        except ValueError:
-            return None
-
-        if suffix and suffix in C.MULTIPLIERS:
-            return base_val * C.MULTIPLIERS[suffix]
-
-        return base_val
+    try:
+        base_val = float(match.group("num"))
+    except ValueError:
+        return None
 
-    return None
+    return base_val * C.MULTIPLIERS.get(match.group("unit") or "", 1.0)
 
 
+@functools.lru_cache(maxsize=4096)
 def float_to_search_string(val: float | None) -> str:
     """
     Converts a float back to a standard engineering string (e.g., '1.5k').
@@ -163,28 +222,16 @@ def float_to_search_string(val: float | None) -> str:
 
     val = float(val)  # Ensure float
 
-    # Resistor/Large values (k, M)
-    # We purposefully iterate high-to-low to find the first fit.
-    for suffix, multiplier in [("M", 1e6), ("k", 1e3)]:
+    # Resistor/Large values (k, M) or Capacitor/Inductor values (u, n, p).
+    # Small prefixes apply only below 1.0 (base unit is Farads/Henries).
+    # Each table is ordered high-to-low so the first fit wins.
+    for suffix, multiplier in _LARGE_SCALES if val >= 1.0 else _SMALL_SCALES:
         if val >= multiplier:
-            reduced = val / multiplier
-            reduced = round(reduced, 6)  # Floating point sanity
-
+            reduced = round(val / multiplier, 6)  # Floating point sanity
             if reduced.is_integer():
                 return f"{int(reduced)}{suffix}"
             return f"{reduced:.1f}{suffix}"
 
-    # Capacitor/Inductor values (u, n, p)
-    # Applied primarily for values < 1.0 (assuming base unit is Farads/Henries)
-    if val < 1.0:
-        for suffix, multiplier in [("u", 1e-6), ("n", 1e-9), ("p", 1e-12)]:
-            if val >= multiplier:
-                reduced = val / multiplier
-                reduced = round(reduced, 6)
-                if reduced.is_integer():
-                    return f"{int(reduced)}{suffix}"
-                return f"{reduced:.1f}{suffix}"
-
     # Fallback for plain numbers (e.g. 100R)
     val = round(val, 6)
     if val.is_integer():
@@ -192,6 +239,7 @@ def float_to_search_string(val: float | None) -> str:
     return str(val)
 
 
+@functools.lru_cache(maxsize=4096)
 def float_to_display_string(val: float) -> str:
     """
     Converts a float to BS 1852 "Sandwich" format (e.g., '1k5').
@@ -208,15 +256,10 @@ def float_to_display_string(val: float) -> str:
     base = float_to_search_string(val)
 
     # Transform 4.7k -> 4k7
-    if "." in base and any(c.isalpha() for c in base):
-        num, rest = base.split(".")
-        # rest contains something like '7k'
-        # Split digits from letters
-        match = re.search(r"(\d+)([a-zA-Z]+)", rest)
-        if match:
-            decimal_part = match.group(1)
-            suffix = match.group(2)
-            return f"{num}{suffix}{decimal_part}"
+    match = _DECIMAL_SI_RE.fullmatch(base)
+    if match:
+        num, decimal_part, suffix = match.groups()
+        return f"{num}{suffix}{decimal_part}"
 
     return base
 
@@ -225,7 +268,7 @@ def get_clean_name(raw_key: str) -> str:
     """Parses '[Source] [Category] Name' into 'Name - Source'."""
     if not raw_key:
         return ""
-    match = re.match(r"^\[(.*?)\] (?:\[(.*?)\] )?(.*)$", raw_key)
+    match = _CLEAN_NAME_RE.match(raw_key)
     if match:
         src = match.group(1)
         name = match.group(3)
@@ -21,7 +21,9 @@ def generate_shopping_list_csv(
     Returns:
         bytes: The CSV content encoded as utf-8-sig.
     """
-    csv_buf = io.StringIO()
+    # Encode as rows are written ("utf-8-sig" so Excel opens special characters)
+    csv_buf = io.BytesIO()
+    csv_text = io.TextIOWrapper(csv_buf, encoding="utf-8-sig", newline="")
 
     # Define columns based on data presence
     fields = [
@@ -39,23 +41,27 @@ def generate_shopping_list_csv(
     if data and "Net Need" in data[0]:
         fields[3:3] = ["In Stock", "Net Need"]
 
-    writer = csv.DictWriter(csv_buf, fieldnames=fields, extrasaction="ignore")
-    writer.writeheader()
+    # Plain csv.writer on value lists; missing keys write as "" like DictWriter
+    writer = csv.writer(csv_text)
+    writer.writerow(fields)
 
-    rows_to_write = []
-    for row in data:
-        if use_excel_formulas and row.get("Tayda_Link"):
-            # Transform the link into a clickable formula
-            clean_row = row.copy()
-            clean_row["Tayda_Link"] = f'=HYPERLINK("{row["Tayda_Link"]}", "Buy")'
-            rows_to_write.append(clean_row)
-        else:
-            rows_to_write.append(row)
+    rows = ([row.get(f, "") for f in fields] for row in data)
+    if use_excel_formulas:
+        # Transform links into clickable formulas
+        link_idx = fields.index("Tayda_Link")
+        rows = (_with_hyperlink(values, link_idx) for values in rows)
+    writer.writerows(rows)
+
+    csv_text.flush()
+    return csv_buf.getvalue()
 
-    writer.writerows(rows_to_write)
 
-    # encode "utf-8-sig" to ensure Excel opens it correctly with special characters
-    return csv_buf.getvalue().encode("utf-8-sig")
+def _with_hyperlink(values: list[Any], link_idx: int) -> list[Any]:
+    """Rewrites a non-empty link cell as an Excel =HYPERLINK() formula."""
+    link = values[link_idx]
+    if link:
+        values[link_idx] = f'=HYPERLINK("{link}", "Buy")'
+    return values
 
 
 def generate_stock_update_csv(data: list[dict[str, Any]]) -> bytes:
@@ -74,10 +80,12 @@ def generate_stock_update_csv(data: list[dict[str, Any]]) -> bytes:
     Returns:
         bytes: The CSV content encoded as utf-8-sig.
     """
-    stock_update_buf = io.StringIO()
-    stock_fields = ["Category", "Part", "Qty"]
-    stock_writer = csv.DictWriter(stock_update_buf, fieldnames=stock_fields)
-    stock_writer.writeheader()
+    stock_update_buf = io.BytesIO()
+    stock_update_text = io.TextIOWrapper(
+        stock_update_buf, encoding="utf-8-sig", newline=""
+    )
+    stock_writer = csv.writer(stock_update_text)
+    stock_writer.writerow(["Category", "Part", "Qty"])
 
     for row in data:
         # Robustly handle potential string/int types from the UI
@@ -90,8 +98,7 @@ def generate_stock_update_csv(data: list[dict[str, Any]]) -> bytes:
 
         # Only write rows where stock remains; omit zero-qty items to keep the CSV clean
         if new_qty > 0:
-            stock_writer.writerow(
-                {"Category": row["Category"], "Part": row["Part"], "Qty": new_qty}
-            )
+            stock_writer.writerow([row["Category"], row["Part"], new_qty])
 
-    return stock_update_buf.getvalue().encode("utf-8-sig")
+    stock_update_text.flush()
+    return stock_update_buf.getvalue()
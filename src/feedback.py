@@ -32,6 +32,20 @@ def get_gsheet_client() -> "gspread.Client":
     return gspread.authorize(creds)
 
 
+@st.cache_resource(ttl="1h")
+def get_feedback_worksheet() -> "gspread.Worksheet":
+    """
+    Opens the feedback worksheet once and reuses it across submissions.
+
+    Looking a spreadsheet up by title is a Drive API round-trip, so the
+    handle is cached alongside the client and refreshed on the same schedule.
+
+    Returns:
+        gspread.Worksheet: The first sheet of "Star Ground Feedback".
+    """
+    return get_gsheet_client().open("Star Ground Feedback").sheet1
+
+
 def save_feedback(rating: str, text: str) -> None:
     """
     Appends a new feedback entry to the "Star Ground Feedback" Google Sheet.
@@ -43,9 +57,11 @@ def save_feedback(rating: str, text: str) -> None:
     Raises:
         Exception: If connection fails or sheet is not found.
     """
-    client = get_gsheet_client()
-    sheet = client.open("Star Ground Feedback").sheet1
+    from gspread.utils import ValueInputOption
+
+    sheet = get_feedback_worksheet()
 
-    # Append timestamp, rating, and comment as a new row
+    # Append timestamp, rating, and comment as a new row. RAW stores the
+    # values verbatim, so comments starting with "=" are never evaluated.
     row = [str(datetime.datetime.now()), rating, text]
-    sheet.append_row(row)
+    sheet.append_row(row, value_input_option=ValueInputOption.raw)
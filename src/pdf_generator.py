@@ -10,17 +10,28 @@ ZIP archives for user download.
 """
 
 import datetime
+import functools
 import io
 import os
 import re
 import zipfile
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
 from fpdf import FPDF
 from fpdf.enums import XPos, YPos
 
 from src.bom_lib import Inventory, ProjectSlot, deduplicate_refs
 
+# PDFs are already compressed internally, so archives store them as-is and
+# only deflate text entries (CSVs, info.txt, plain-text source documents)
+_ZIP_PDF_COMPRESSION = zipfile.ZIP_STORED
+_ZIP_TEXT_COMPRESSION = zipfile.ZIP_DEFLATED
+
+# Splits a reference designator into prefix and number ("R12" -> "R", "12")
+_REF_PARTS_RE = re.compile(r"([a-zA-Z]+)(\d+)")
+
 
 def condense_refs(refs: list[str]) -> str:
     """
@@ -38,59 +49,39 @@ def condense_refs(refs: list[str]) -> str:
     """
     if not refs:
         return ""
+    return _condense_refs_cached(tuple(refs))
+
 
+@functools.lru_cache(maxsize=4096)
+def _condense_refs_cached(refs: tuple[str, ...]) -> str:
+    """Memoized body of condense_refs, keyed on the hashable ref tuple."""
     # 1. Parse into (Prefix, Number) tuples
     parsed = []
-    pattern = re.compile(r"([a-zA-Z]+)(\d+)")
-
     unparseable = []
 
-    for r in refs:
-        m = pattern.match(r)
+    for r, m in zip(refs, map(_REF_PARTS_RE.match, refs), strict=True):
         if m:
             parsed.append((m.group(1), int(m.group(2))))
         else:
             unparseable.append(r)
 
     # 2. Sort primarily by Prefix (C, R, U), secondarily by Number (1, 2, 10)
-    parsed.sort(key=lambda x: (x[0], x[1]))
-
-    # 3. Group by Prefix
-    groups = defaultdict(list)
-    for p, n in parsed:
-        groups[p].append(n)
+    parsed.sort()
 
     result_parts = sorted(unparseable)
 
-    # 4. Range Finding Algorithm
-    for prefix in sorted(groups.keys()):
-        nums = groups[prefix]
-        if not nums:
-            continue
-
-        ranges = []
-        start = nums[0]
-        prev = nums[0]
+    # 3. Group by Prefix (parsed is sorted, so each prefix is one contiguous run)
+    for prefix, items in groupby(parsed, key=itemgetter(0)):
+        nums = [n for _, n in items]
 
-        for n in nums[1:]:
-            if n == prev + 1:
-                prev = n
+        # 4. Range Finding: consecutive numbers share the same (number - index)
+        for _, run in groupby(enumerate(nums), key=lambda p: p[1] - p[0]):
+            span = list(run)
+            start, end = span[0][1], span[-1][1]
+            if start == end:
+                result_parts.append(f"{prefix}{start}")
             else:
-                # Range break detected
-                if start == prev:
-                    ranges.append(f"{prefix}{start}")
-                else:
-                    ranges.append(f"{prefix}{start}-{prefix}{prev}")
-                start = n
-                prev = n
-
-        # Handle the final range
-        if start == prev:
-            ranges.append(f"{prefix}{start}")
-        else:
-            ranges.append(f"{prefix}{start}-{prefix}{prev}")
-
-        result_parts.extend(ranges)
+                result_parts.append(f"{prefix}{start}-{prefix}{end}")
 
     return ", ".join(result_parts)
 
@@ -409,8 +400,39 @@ def float_val_check(val_str: str) -> float:
     return 0.0
 
 
+def _index_inventory_by_project(
+    inventory: Inventory, slots: list[ProjectSlot]
+) -> dict[str, list[tuple[str, str, list[str]]]]:
+    """
+    Groups the inventory by contributing project in a single pass.
+
+    Args:
+        inventory (Inventory): The master inventory object.
+        slots (list[ProjectSlot]): The project slots; only their projects are indexed.
+
+    Returns:
+        dict: Project name -> [(category, value, unique_refs), ...], with parts
+        in inventory order and projects that contributed no refs omitted.
+    """
+    wanted = {slot.locked_name or slot.name for slot in slots}
+    parts_by_project: dict[str, list[tuple[str, str, list[str]]]] = defaultdict(list)
+
+    for key, data in inventory.items():
+        cat, val = key.split(" | ", 1)
+        for project_name, refs in data["sources"].items():
+            if project_name not in wanted:
+                continue
+            unique_refs = deduplicate_refs(refs)
+            if unique_refs:
+                parts_by_project[project_name].append((cat, val, unique_refs))
+
+    return parts_by_project
+
+
 def _write_field_manuals(
-    zf: zipfile.ZipFile, inventory: Inventory, slots: list[ProjectSlot]
+    zf: zipfile.ZipFile,
+    parts_by_project: dict[str, list[tuple[str, str, list[str]]]],
+    slots: list[ProjectSlot],
 ) -> None:
     """Helper: Generates Field Manual PDFs and writes them to the ZIP archive."""
     processed_projects = set()
@@ -428,32 +450,25 @@ def _write_field_manuals(
         pdf = FieldManual()
         project_parts = []
 
-        # Filter Global Inventory for this specific Project
-        for key, data in inventory.items():
-            sources = data["sources"]
-            if project_name in sources:
-                unique_refs = deduplicate_refs(sources[project_name])
-                if unique_refs:
-                    cat, val = key.split(" | ", 1)
-
-                    # Annotations Logic
-                    row_notes = ""
-                    if "DIP SOCKET" in val:
-                        row_notes = "[!] Check Size"
-                    is_polarized = cat in ["Diodes", "Transistors", "ICs"] or (
-                        cat == "Capacitors" and ("u" in val or "µ" in val)
-                    )
-
-                    project_parts.append(
-                        {
-                            "category": cat,
-                            "value": val,
-                            "qty": len(unique_refs),
-                            "refs": unique_refs,
-                            "notes": row_notes,
-                            "polarized": is_polarized,
-                        }
-                    )
+        for cat, val, unique_refs in parts_by_project.get(project_name, []):
+            # Annotations Logic
+            row_notes = ""
+            if "DIP SOCKET" in val:
+                row_notes = "[!] Check Size"
+            is_polarized = cat in ["Diodes", "Transistors", "ICs"] or (
+                cat == "Capacitors" and ("u" in val or "µ" in val)
+            )
+
+            project_parts.append(
+                {
+                    "category": cat,
+                    "value": val,
+                    "qty": len(unique_refs),
+                    "refs": unique_refs,
+                    "notes": row_notes,
+                    "polarized": is_polarized,
+                }
+            )
 
         if project_parts:
             # Sort parts by Z-Height for the manual
@@ -467,7 +482,9 @@ def _write_field_manuals(
 
 
 def _write_stickers(
-    zf: zipfile.ZipFile, inventory: Inventory, slots: list[ProjectSlot]
+    zf: zipfile.ZipFile,
+    parts_by_project: dict[str, list[tuple[str, str, list[str]]]],
+    slots: list[ProjectSlot],
 ) -> None:
     """Helper: Generates Sticker Sheet PDFs and writes them to the ZIP archive."""
     processed_projects = set()
@@ -482,14 +499,10 @@ def _write_stickers(
             continue
         processed_projects.add(project_name)
 
-        project_parts = []
-        for key, data in inventory.items():
-            sources = data["sources"]
-            if project_name in sources:
-                unique_refs = deduplicate_refs(sources[project_name])
-                if unique_refs:
-                    _, val = key.split(" | ", 1)
-                    project_parts.append((val, unique_refs))
+        project_parts = [
+            (val, unique_refs)
+            for _, val, unique_refs in parts_by_project.get(project_name, [])
+        ]
 
         if not project_parts:
             continue
@@ -497,7 +510,7 @@ def _write_stickers(
         pdf = StickerSheet()
         # Generate a 4-char Short Code for the label (e.g. "Big Muff" -> "BIGM")
         code = "".join([c for c in project_name if c.isalnum()]).upper()[:4]
-        project_parts.sort(key=lambda x: x[0])
+        project_parts.sort(key=itemgetter(0))
 
         for val, refs in project_parts:
             pdf.add_sticker(code, val, refs, len(refs))
@@ -520,9 +533,10 @@ def generate_pdf_bundle(inventory: Inventory, slots: list[ProjectSlot]) -> bytes
         bytes: The binary content of the ZIP file.
     """
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        _write_field_manuals(zf, inventory, slots)
-        _write_stickers(zf, inventory, slots)
+    parts_by_project = _index_inventory_by_project(inventory, slots)
+    with zipfile.ZipFile(zip_buffer, "w", _ZIP_PDF_COMPRESSION) as zf:
+        _write_field_manuals(zf, parts_by_project, slots)
+        _write_stickers(zf, parts_by_project, slots)
     return zip_buffer.getvalue()
 
 
@@ -552,10 +566,14 @@ def generate_master_zip(
     """
     zip_buffer = io.BytesIO()
 
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_buffer, "w", _ZIP_PDF_COMPRESSION) as zf:
         # 1. Root Files
-        zf.writestr("Shopping List.csv", shopping_list_csv)
-        zf.writestr("My Inventory Updated.csv", stock_csv)
+        zf.writestr(
+            "Shopping List.csv", shopping_list_csv, compress_type=_ZIP_TEXT_COMPRESSION
+        )
+        zf.writestr(
+            "My Inventory Updated.csv", stock_csv, compress_type=_ZIP_TEXT_COMPRESSION
+        )
 
         info_text = (
             "Star Ground v2.1.2\n"
@@ -570,11 +588,12 @@ def generate_master_zip(
             "Github Page:\n"
             "https://github.com/JacksonFergusonDev/star-ground\n"
         )
-        zf.writestr("info.txt", info_text)
+        zf.writestr("info.txt", info_text, compress_type=_ZIP_TEXT_COMPRESSION)
 
-        # 2. Generated PDFs
-        _write_field_manuals(zf, inventory, slots)
-        _write_stickers(zf, inventory, slots)
+        # 2. Generated PDFs (both built from one pass over the inventory)
+        parts_by_project = _index_inventory_by_project(inventory, slots)
+        _write_field_manuals(zf, parts_by_project, slots)
+        _write_stickers(zf, parts_by_project, slots)
 
         # 3. Source Documents (Preservation Logic)
         used_filenames = set()
@@ -586,30 +605,33 @@ def generate_master_zip(
 
             safe_name = re.sub(r'[<>:"/\\|?*]', "", project_name).strip()
 
-            file_content = None
-            dest_name = ""
-
             # Strategy A: Use Cached Bytes (URL/Upload)
             if slot.cached_pdf_bytes:
-                file_content = slot.cached_pdf_bytes
                 dest_name = f"Source Documents/{safe_name} Source.pdf"
+                if dest_name not in used_filenames:
+                    zf.writestr(dest_name, slot.cached_pdf_bytes)
+                    used_filenames.add(dest_name)
 
-            # Strategy B: Use Local Path (Preset)
+            # Strategy B: Use Local Path (Preset), streamed in chunks by ZipFile
             elif slot.source_path:
+                src_path = slot.source_path
+                _, ext = os.path.splitext(src_path)
+                dest_name = f"Source Documents/{safe_name} Source{ext or '.txt'}"
+                if dest_name in used_filenames:
+                    continue
                 try:
-                    src_path = slot.source_path
-                    _, ext = os.path.splitext(src_path)
-                    if not ext:
-                        ext = ".txt"
-
-                    with open(src_path, "rb") as f:
-                        file_content = f.read()
-                    dest_name = f"Source Documents/{safe_name} Source{ext}"
+                    if os.path.isfile(src_path) and os.path.getsize(src_path) > 0:
+                        zf.write(
+                            src_path,
+                            arcname=dest_name,
+                            compress_type=(
+                                _ZIP_PDF_COMPRESSION
+                                if ext.lower() == ".pdf"
+                                else _ZIP_TEXT_COMPRESSION
+                            ),
+                        )
+                        used_filenames.add(dest_name)
                 except Exception:
                     pass
 
-            if file_content and dest_name and dest_name not in used_filenames:
-                zf.writestr(dest_name, file_content)
-                used_filenames.add(dest_name)
-
     return zip_buffer.getvalue()
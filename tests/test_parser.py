@@ -29,11 +29,16 @@ from src.bom_lib import (
     get_buy_details,
     get_spec_type,
     get_standard_hardware,
+    parse_csv_bom,
     parse_user_inventory,
     parse_value_to_float,
     parse_with_verification,
+    process_input_batch,
+    process_input_data,
 )
-from src.bom_lib.types import Inventory
+from src.bom_lib.parser import ingest_bom_batch, ingest_bom_line
+from src.bom_lib.sourcing import get_injection_warnings
+from src.bom_lib.types import Inventory, create_empty_stats
 
 # --- Standard Unit Tests ---
 
@@ -204,6 +209,23 @@ def test_float_engine_round_trip():
     assert "u" in out or "n" in out
 
 
+def test_value_parsing_fast_paths():
+    """
+    Verifies that plain integers and simple suffixed values (which skip the
+    regex engine) parse identically to the general notation rules.
+    """
+    assert parse_value_to_float("100") == 100.0
+    assert parse_value_to_float("10k") == 10000.0
+    assert parse_value_to_float("10 K") == 10000.0
+    assert parse_value_to_float("4.7u") == 4.7e-6
+    assert parse_value_to_float("1e3") == 1.0  # Not scientific notation
+    assert parse_value_to_float("1.2.3k") is None
+
+    # Micro sign and Greek mu fold to ASCII 'u'
+    assert parse_value_to_float("4.7\u00b5") == parse_value_to_float("4.7u")
+    assert parse_value_to_float("4\u03bc7") == parse_value_to_float("4u7")
+
+
 def test_bs1852_formatting():
     """
     Verifies the 'BS 1852' (European) formatting style.
@@ -559,6 +581,48 @@ Resistors,1k5,20
         os.remove(tmp_path)
 
 
+def test_csv_bom_column_resolution(tmp_path):
+    """
+    Verifies header alias resolution and the two-column positional fallback
+    in the CSV BOM parser.
+    """
+    aliased = tmp_path / "aliased.csv"
+    aliased.write_text("Designator, Value ,Ref\nR1,10k,\n,100n,C1\n,,\n")
+    inventory, stats = parse_csv_bom(str(aliased), "Aliased")
+
+    # Empty preferred column falls through to the next alias
+    assert inventory["Resistors | 10k"]["refs"] == ["R1"]
+    assert inventory["Capacitors | 100n"]["refs"] == ["C1"]
+    assert stats["lines_read"] == 3
+    assert len(stats["residuals"]) == 1
+
+    positional = tmp_path / "positional.csv"
+    positional.write_text("Foo,Bar\nR2,4k7\n")
+    inventory, _ = parse_csv_bom(str(positional), "Positional")
+    assert inventory["Resistors | 4.7k"]["refs"] == ["R2"]
+
+
+def test_csv_upload_parsed_in_memory():
+    """
+    Verifies that uploaded CSV bytes (BOM included) are parsed from memory.
+    """
+
+    class FakeUpload:
+        name = "bom.CSV"
+
+        def getvalue(self) -> bytes:
+            return "\ufeffRef,Value\nR1,10k\n".encode()
+
+    inventory, stats, title, content = process_input_data(
+        "Upload File", FakeUpload(), "Upload"
+    )
+
+    assert inventory["Resistors | 10k"]["refs"] == ["R1"]
+    assert stats["parts_found"] == 1
+    assert title is None
+    assert content is None
+
+
 def test_net_needs_calculation():
     """
     Verifies the inventory subtraction logic.
@@ -638,3 +702,70 @@ def test_ref_deduplication_and_sorting():
 
     # 4. Empty Safety
     assert deduplicate_refs([]) == []
+
+    # 5. Case-only duplicates keep first-seen order (stable across runs)
+    assert deduplicate_refs(["r1", "R1", "R2"]) == ["r1", "R1", "R2"]
+    assert deduplicate_refs(["R1", "r1", "R2"]) == ["R1", "r1", "R2"]
+
+
+def test_inventory_add_parts_matches_add_part():
+    """
+    Verifies that batch recording is equivalent to per-ref recording.
+    """
+    single = Inventory()
+    for ref in ("R1", "R2", "R3"):
+        single.add_part("Src", "Resistors | 10k", ref)
+
+    batched = Inventory()
+    batched.add_parts("Src", "Resistors | 10k", ["R1", "R2", "R3"])
+
+    assert batched == single
+    assert batched["Resistors | 10k"]["val_float"] == 10000.0
+
+
+def test_injection_warnings_do_not_create_entries():
+    """
+    Verifies that checking for injected hardware is read-only.
+    """
+    inventory = Inventory()
+    inventory.add_part("Src", "Resistors | 10k", "R1")
+
+    assert get_injection_warnings(inventory) == []
+    assert list(inventory) == ["Resistors | 10k"]
+    assert inventory.qty("Resistors | 10k") == 1
+
+
+def test_ingest_bom_batch_matches_line_by_line():
+    """
+    Verifies that batch ingestion matches sequential per-line ingestion,
+    including de-duplication across rows and socket injection.
+    """
+    rows = [("R1-R3", "10k"), ("IC1", "TL072"), ("R2", "10k"), ("C1", "100n")]
+
+    seq_inv = Inventory()
+    seq_stats = create_empty_stats()
+    seq_found = sum(
+        ingest_bom_line(seq_inv, "Src", ref, val, seq_stats) for ref, val in rows
+    )
+
+    batch_inv = Inventory()
+    batch_stats = create_empty_stats()
+    batch_found = ingest_bom_batch(batch_inv, "Src", rows, batch_stats)
+
+    assert batch_found == seq_found == 5
+    assert list(batch_inv.items()) == list(seq_inv.items())
+    assert batch_stats["seen_refs"] == seq_stats["seen_refs"]
+
+
+def test_process_input_batch_preserves_job_order():
+    """
+    Verifies that concurrent loading returns one result per job, in order.
+    """
+    jobs = [("Paste Text", f"R1 {i}k", f"Project {i}") for i in range(1, 6)]
+    results = process_input_batch(jobs)
+
+    assert len(results) == len(jobs)
+    for i, (inv, stats, _, _) in enumerate(results, start=1):
+        assert list(inv) == [f"Resistors | {i}k"]
+        assert inv[f"Resistors | {i}k"]["sources"] == {f"Project {i}": ["R1"]}
+        assert stats["parts_found"] == 1